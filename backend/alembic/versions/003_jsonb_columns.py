@@ -0,0 +1,51 @@
+"""Convert JSON payload columns to JSONB
+
+Revision ID: 003_jsonb_columns
+Revises: 002_add_payment_invoices
+Create Date: 2026-10-17
+
+Switches the textual ``json`` columns to binary ``jsonb`` so PostgreSQL
+stores a pre-parsed tree (no re-parse on read) and can serve key lookups
+and containment queries from GIN indexes:
+- analyses.progress, analyses.scores, analyses.report
+- analysis_cache.data
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+
+
+revision: str = "003_jsonb_columns"
+down_revision: Union[str, None] = "002_add_payment_invoices"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+JSON_COLUMNS = (
+    ("analyses", "progress"),
+    ("analyses", "scores"),
+    ("analyses", "report"),
+    ("analysis_cache", "data"),
+)
+
+
+def upgrade() -> None:
+    if op.get_context().dialect.name != "postgresql":
+        return
+
+    # USING cast rewrites existing rows in place
+    for table, column in JSON_COLUMNS:
+        op.execute(
+            f"ALTER TABLE {table} ALTER COLUMN {column} TYPE jsonb USING {column}::jsonb"
+        )
+
+
+def downgrade() -> None:
+    if op.get_context().dialect.name != "postgresql":
+        return
+
+    for table, column in JSON_COLUMNS:
+        op.execute(
+            f"ALTER TABLE {table} ALTER COLUMN {column} TYPE json USING {column}::json"
+        )
@@ -0,0 +1,40 @@
+"""Add GIN indexes on analyses report/scores
+
+Revision ID: 004_analyses_jsonb_gin_indexes
+Revises: 003_jsonb_columns
+Create Date: 2026-10-17
+
+Indexes the JSONB report and scores columns with the jsonb_path_ops
+operator class. It only supports containment (@>) but is considerably
+smaller than the default GIN opclass, which is all the dashboard filters use.
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+
+
+revision: str = "004_analyses_jsonb_gin_indexes"
+down_revision: Union[str, None] = "003_jsonb_columns"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    if op.get_context().dialect.name != "postgresql":
+        return
+
+    op.execute(
+        "CREATE INDEX ix_analyses_report_gin ON analyses USING GIN (report jsonb_path_ops)"
+    )
+    op.execute(
+        "CREATE INDEX ix_analyses_scores_gin ON analyses USING GIN (scores jsonb_path_ops)"
+    )
+
+
+def downgrade() -> None:
+    if op.get_context().dialect.name != "postgresql":
+        return
+
+    op.execute("DROP INDEX IF EXISTS ix_analyses_scores_gin")
+    op.execute("DROP INDEX IF EXISTS ix_analyses_report_gin")
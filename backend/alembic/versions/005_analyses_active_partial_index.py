@@ -0,0 +1,37 @@
+"""Replace status/created_at index with partial index on in-flight jobs
+
+Revision ID: 005_analyses_active_partial_index
+Revises: 004_analyses_jsonb_gin_indexes
+Create Date: 2026-10-17
+
+ix_analyses_status_created covered every row, so it grew with completed
+history even though polling only looks at pending/processing jobs. The
+partial index stays proportional to the number of active jobs. Lookups by
+an arbitrary status still use the single-column ix_analyses_status.
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+revision: str = "005_analyses_active_partial_index"
+down_revision: Union[str, None] = "004_analyses_jsonb_gin_indexes"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.drop_index("ix_analyses_status_created", table_name="analyses")
+    op.execute(
+        "CREATE INDEX ix_analyses_active ON analyses (created_at DESC) "
+        "WHERE status IN ('pending', 'processing')"
+    )
+
+
+def downgrade() -> None:
+    op.execute("DROP INDEX IF EXISTS ix_analyses_active")
+    op.create_index(
+        "ix_analyses_status_created", "analyses", ["status", sa.text("created_at DESC")]
+    )
@@ -0,0 +1,46 @@
+"""Make the analysis_cache key index covering
+
+Revision ID: 006_cache_key_covering_index
+Revises: 005_analyses_active_partial_index
+Create Date: 2026-10-17
+
+Replaces the plain unique index on cache_key with a unique covering index
+that carries expires_at, so freshness checks are answered by an index-only
+scan. The data payload is deliberately not included: btree index tuples
+are capped at ~2.7kB and cached API responses routinely exceed that.
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+
+
+revision: str = "006_cache_key_covering_index"
+down_revision: Union[str, None] = "005_analyses_active_partial_index"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    if op.get_context().dialect.name != "postgresql":
+        return
+
+    op.execute(
+        "CREATE UNIQUE INDEX ix_cache_key_covering "
+        "ON analysis_cache (cache_key) INCLUDE (expires_at)"
+    )
+    op.execute("DROP INDEX IF EXISTS ix_analysis_cache_cache_key")
+    op.execute(
+        "ALTER TABLE analysis_cache "
+        "DROP CONSTRAINT IF EXISTS analysis_cache_cache_key_key"
+    )
+
+
+def downgrade() -> None:
+    if op.get_context().dialect.name != "postgresql":
+        return
+
+    op.create_index(
+        "ix_analysis_cache_cache_key", "analysis_cache", ["cache_key"], unique=True
+    )
+    op.execute("DROP INDEX IF EXISTS ix_cache_key_covering")
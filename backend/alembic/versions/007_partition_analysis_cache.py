@@ -0,0 +1,131 @@
+"""Range-partition analysis_cache by expires_at
+
+Revision ID: 007_partition_analysis_cache
+Revises: 006_cache_key_covering_index
+Create Date: 2026-10-17
+
+Rebuilds analysis_cache as a table partitioned by day on expires_at so TTL
+eviction becomes DROP TABLE on a fully expired partition rather than a
+row-by-row DELETE. A DEFAULT partition catches rows outside the pre-created
+window; the maintain_cache_partitions task keeps the window rolling.
+
+PostgreSQL requires unique indexes on a partitioned table to include the
+partition key, so the primary key becomes (id, expires_at) and the
+cache_key index is no longer unique. Unexpired rows are carried over.
+"""
+
+from datetime import datetime, timedelta
+from typing import Sequence, Union
+
+from alembic import op
+
+
+revision: str = "007_partition_analysis_cache"
+down_revision: Union[str, None] = "006_cache_key_covering_index"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+# Daily partitions created up front (longest cache TTL is one week)
+PARTITION_DAYS_AHEAD = 14
+
+COLUMNS = "id, cache_key, url, data_type, data, expires_at, created_at"
+
+
+def _create_table(name: str, primary_key: str, partition_by: str = "") -> None:
+    op.execute(
+        f"""
+        CREATE TABLE {name} (
+            id VARCHAR(36) NOT NULL,
+            cache_key VARCHAR(512) NOT NULL,
+            url VARCHAR(2048) NOT NULL,
+            data_type VARCHAR(50) NOT NULL,
+            data JSONB NOT NULL,
+            expires_at TIMESTAMP WITHOUT TIME ZONE NOT NULL,
+            created_at TIMESTAMP WITHOUT TIME ZONE NOT NULL DEFAULT now(),
+            CONSTRAINT analysis_cache_pkey PRIMARY KEY ({primary_key})
+        ) {partition_by}
+        """
+    )
+
+
+def _drop_indexes() -> None:
+    op.execute("DROP INDEX IF EXISTS ix_cache_key_covering")
+    op.execute("DROP INDEX IF EXISTS ix_cache_url_type")
+    op.execute("DROP INDEX IF EXISTS ix_analysis_cache_expires_at")
+
+
+def upgrade() -> None:
+    if op.get_context().dialect.name != "postgresql":
+        return
+
+    # Free the index/constraint names before building the new parent table
+    op.execute("ALTER TABLE analysis_cache RENAME TO analysis_cache_legacy")
+    op.execute(
+        "ALTER TABLE analysis_cache_legacy "
+        "RENAME CONSTRAINT analysis_cache_pkey TO analysis_cache_legacy_pkey"
+    )
+    _drop_indexes()
+
+    _create_table("analysis_cache", "id, expires_at", "PARTITION BY RANGE (expires_at)")
+
+    op.execute(
+        "CREATE TABLE analysis_cache_default PARTITION OF analysis_cache DEFAULT"
+    )
+    # expires_at is naive UTC, so partition days are UTC days
+    today = datetime.utcnow().date()
+    for offset in range(PARTITION_DAYS_AHEAD + 1):
+        start = today + timedelta(days=offset)
+        end = start + timedelta(days=1)
+        op.execute(
+            f"CREATE TABLE analysis_cache_p{start:%Y%m%d} PARTITION OF analysis_cache "
+            f"FOR VALUES FROM ('{start.isoformat()}') TO ('{end.isoformat()}')"
+        )
+
+    op.execute(
+        f"INSERT INTO analysis_cache ({COLUMNS}) "
+        f"SELECT {COLUMNS} FROM analysis_cache_legacy WHERE expires_at > now()"
+    )
+    op.execute("DROP TABLE analysis_cache_legacy")
+
+    # Indexes on the parent propagate to every partition
+    op.execute("CREATE INDEX ix_cache_url_type ON analysis_cache (url, data_type)")
+    op.execute(
+        "CREATE INDEX ix_analysis_cache_expires_at ON analysis_cache (expires_at)"
+    )
+    op.execute(
+        "CREATE INDEX ix_cache_key_covering "
+        "ON analysis_cache (cache_key) INCLUDE (expires_at)"
+    )
+
+
+def downgrade() -> None:
+    if op.get_context().dialect.name != "postgresql":
+        return
+
+    op.execute("ALTER TABLE analysis_cache RENAME TO analysis_cache_partitioned")
+    op.execute(
+        "ALTER TABLE analysis_cache_partitioned "
+        "RENAME CONSTRAINT analysis_cache_pkey TO analysis_cache_partitioned_pkey"
+    )
+    _drop_indexes()
+
+    _create_table("analysis_cache", "id")
+
+    # Keep only the newest row per key to restore cache_key uniqueness
+    op.execute(
+        f"INSERT INTO analysis_cache ({COLUMNS}) "
+        f"SELECT DISTINCT ON (cache_key) {COLUMNS} FROM analysis_cache_partitioned "
+        "WHERE expires_at > now() ORDER BY cache_key, expires_at DESC"
+    )
+    # Dropping the parent drops every partition with it
+    op.execute("DROP TABLE analysis_cache_partitioned")
+
+    op.execute("CREATE INDEX ix_cache_url_type ON analysis_cache (url, data_type)")
+    op.execute(
+        "CREATE INDEX ix_analysis_cache_expires_at ON analysis_cache (expires_at)"
+    )
+    op.execute(
+        "CREATE UNIQUE INDEX ix_cache_key_covering "
+        "ON analysis_cache (cache_key) INCLUDE (expires_at)"
+    )
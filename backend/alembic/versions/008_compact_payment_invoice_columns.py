@@ -0,0 +1,47 @@
+"""Store invoice nonce as bytea and amount as uint256-safe numeric
+
+Revision ID: 008_compact_payment_invoice_columns
+Revises: 007_partition_analysis_cache
+Create Date: 2026-10-17
+
+- nonce: VARCHAR(66) hex text -> BYTEA (32 raw bytes), halving the row
+  and unique index footprint
+- amount_atomic: BIGINT -> NUMERIC(78,0), wide enough for any uint256
+
+tx_hash stays VARCHAR(66): when the relayer only queues a transfer it
+returns a job id instead of a transaction hash, and that is stored there.
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+
+
+revision: str = "008_compact_payment_invoice_columns"
+down_revision: Union[str, None] = "007_partition_analysis_cache"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    if op.get_context().dialect.name != "postgresql":
+        return
+
+    op.execute(
+        "ALTER TABLE payment_invoices ALTER COLUMN amount_atomic TYPE NUMERIC(78, 0)"
+    )
+    op.execute(
+        "ALTER TABLE payment_invoices "
+        "ALTER COLUMN nonce TYPE BYTEA USING decode(substring(nonce from 3), 'hex')"
+    )
+
+
+def downgrade() -> None:
+    if op.get_context().dialect.name != "postgresql":
+        return
+
+    op.execute(
+        "ALTER TABLE payment_invoices "
+        "ALTER COLUMN nonce TYPE VARCHAR(66) USING '0x' || encode(nonce, 'hex')"
+    )
+    op.execute("ALTER TABLE payment_invoices ALTER COLUMN amount_atomic TYPE BIGINT")
@@ -0,0 +1,39 @@
+"""Add a hash index for analysis_cache key lookups
+
+Revision ID: 009_cache_key_hash_index
+Revises: 008_compact_payment_invoice_columns
+Create Date: 2026-10-17
+
+cache_key is only ever compared for equality, and since partitioning it no
+longer has to back a unique constraint. A hash index stores a 4-byte hash
+code per entry instead of the full key, so it is much smaller than a btree
+and resolves a key probe in a single bucket. It sits alongside the covering
+btree from 006, which still answers freshness checks on expires_at with an
+index-only scan.
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+
+
+revision: str = "009_cache_key_hash_index"
+down_revision: Union[str, None] = "008_compact_payment_invoice_columns"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    if op.get_context().dialect.name != "postgresql":
+        return
+
+    op.execute(
+        "CREATE INDEX ix_cache_key_hash ON analysis_cache USING HASH (cache_key)"
+    )
+
+
+def downgrade() -> None:
+    if op.get_context().dialect.name != "postgresql":
+        return
+
+    op.execute("DROP INDEX IF EXISTS ix_cache_key_hash")
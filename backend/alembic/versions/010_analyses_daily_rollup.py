@@ -0,0 +1,48 @@
+"""Add analyses_daily_rollup materialized view
+
+Revision ID: 010_analyses_daily_rollup
+Revises: 009_cache_key_hash_index
+Create Date: 2026-10-17
+
+Pre-aggregates analysis counts and average processing time per day and
+status, so dashboard queries scan one row per (day, status) instead of
+the whole analyses table. The unique index is required for
+REFRESH MATERIALIZED VIEW CONCURRENTLY, which the refresh_analyses_rollup
+beat task runs every few minutes.
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+
+
+revision: str = "010_analyses_daily_rollup"
+down_revision: Union[str, None] = "009_cache_key_hash_index"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    if op.get_context().dialect.name != "postgresql":
+        return
+
+    op.execute(
+        "CREATE MATERIALIZED VIEW analyses_daily_rollup AS "
+        "SELECT date_trunc('day', created_at) AS day, "
+        "status, "
+        "count(*) AS analysis_count, "
+        "avg(processing_time_seconds) AS avg_processing_time_seconds "
+        "FROM analyses "
+        "GROUP BY 1, 2"
+    )
+    op.execute(
+        "CREATE UNIQUE INDEX ix_analyses_daily_rollup_day_status "
+        "ON analyses_daily_rollup (day, status)"
+    )
+
+
+def downgrade() -> None:
+    if op.get_context().dialect.name != "postgresql":
+        return
+
+    op.execute("DROP MATERIALIZED VIEW IF EXISTS analyses_daily_rollup")
@@ -0,0 +1,79 @@
+"""Store primary key ids as native uuid
+
+Revision ID: 011_native_uuid_ids
+Revises: 010_analyses_daily_rollup
+Create Date: 2026-10-17
+
+The id columns were created as VARCHAR(36) text. Native uuid is 16 bytes
+instead of 37, so primary key index pages hold over twice as many entries
+and comparisons are fixed-width instead of collation-aware string
+compares. The users/api_keys tables aren't created by these migrations,
+so they are converted only if they exist.
+"""
+
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+from alembic import op
+
+
+revision: str = "011_native_uuid_ids"
+down_revision: Union[str, None] = "010_analyses_daily_rollup"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+MIGRATED_TABLES = ("analyses", "analysis_cache", "payment_invoices")
+
+
+def _alter_column(table: str, column: str, column_type: str, cast: str) -> None:
+    op.execute(
+        f"ALTER TABLE {table} ALTER COLUMN {column} TYPE {column_type} "
+        f"USING {column}::{cast}"
+    )
+
+
+def _alter_ids(column_type: str, cast: str) -> None:
+    """Change every id column (and the api_keys FK) to the given type."""
+    for table in MIGRATED_TABLES:
+        _alter_column(table, "id", column_type, cast)
+
+    inspector = sa.inspect(op.get_bind())
+    if not inspector.has_table("users"):
+        return
+
+    has_api_keys = inspector.has_table("api_keys")
+
+    # The FK has to be dropped while both sides change type
+    foreign_keys = inspector.get_foreign_keys("api_keys") if has_api_keys else []
+    for fk in foreign_keys:
+        op.drop_constraint(fk["name"], "api_keys", type_="foreignkey")
+
+    _alter_column("users", "id", column_type, cast)
+    if has_api_keys:
+        _alter_column("api_keys", "id", column_type, cast)
+        _alter_column("api_keys", "user_id", column_type, cast)
+
+    for fk in foreign_keys:
+        op.create_foreign_key(
+            fk["name"],
+            "api_keys",
+            "users",
+            fk["constrained_columns"],
+            fk["referred_columns"],
+            ondelete=fk.get("options", {}).get("ondelete"),
+        )
+
+
+def upgrade() -> None:
+    if op.get_context().dialect.name != "postgresql":
+        return
+
+    _alter_ids("UUID", "uuid")
+
+
+def downgrade() -> None:
+    if op.get_context().dialect.name != "postgresql":
+        return
+
+    _alter_ids("VARCHAR(36)", "text")
@@ -0,0 +1,44 @@
+"""Add per-data_type partial GIN indexes on analysis_cache.data
+
+Revision ID: 012_cache_data_partial_gin
+Revises: 011_native_uuid_ids
+Create Date: 2026-10-17
+
+Each data_type caches a payload with its own shape (PageSpeed results,
+SERP listings, Wikipedia summaries...). One GIN index per data_type,
+limited with a WHERE clause, keeps each index small and free of
+unrelated keys, and the planner picks it whenever a query filters on
+that data_type.
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+
+
+revision: str = "012_cache_data_partial_gin"
+down_revision: Union[str, None] = "011_native_uuid_ids"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+CACHE_DATA_TYPES = ("pagespeed", "serp", "twitter", "wikipedia", "openai")
+
+
+def upgrade() -> None:
+    if op.get_context().dialect.name != "postgresql":
+        return
+
+    for data_type in CACHE_DATA_TYPES:
+        op.execute(
+            f"CREATE INDEX ix_cache_data_{data_type} ON analysis_cache "
+            f"USING GIN (data jsonb_path_ops) WHERE data_type = '{data_type}'"
+        )
+
+
+def downgrade() -> None:
+    if op.get_context().dialect.name != "postgresql":
+        return
+
+    for data_type in CACHE_DATA_TYPES:
+        op.execute(f"DROP INDEX IF EXISTS ix_cache_data_{data_type}")
@@ -25,12 +25,224 @@
 # =============================================================================
 
 from typing import Dict, Any, List
+from bisect import bisect_right
+import asyncio
+import re
 
 from app.config import settings
 from app.analyzers.base import BaseAnalyzer, AnalyzerResult
 from app.models.report import Finding, Recommendation, SeverityLevel
-from app.services.wikipedia_service import WikipediaService
-from app.services.google_search_service import GoogleSearchService
+
+# =============================================================================
+# Precomputed Lookup Tables
+# =============================================================================
+# Severity members used by the per-analysis findings, bound once so each
+# Finding skips the Enum metaclass attribute lookup
+_INFO, _LOW = SeverityLevel.INFO, SeverityLevel.LOW
+
+# Recommended schema groups: (result flag, accepted @type values, points)
+SCHEMA_GROUPS = (
+    ("has_organization", frozenset({"Organization", "Corporation"}), 30),
+    ("has_faq", frozenset({"FAQPage"}), 20),
+    ("has_product", frozenset({"Product", "SoftwareApplication"}), 15),
+    ("has_article", frozenset({"Article", "BlogPosting"}), 15),
+    ("has_breadcrumb", frozenset({"BreadcrumbList"}), 10),
+)
+
+# Max points per component: wikipedia, schema, content depth, SERP, knowledge panel
+SCORE_WEIGHTS = (30, 25, 20, 15, 10)
+
+# SERP points by tier: none, ranked beyond top 10, top 10, top 3
+SERP_TIER_POINTS = (0, 5, 10, SCORE_WEIGHTS[3])
+
+# Knowledge panel points by tier: none, implied by Wikipedia, likely
+PANEL_TIER_POINTS = (0, 5, SCORE_WEIGHTS[4])
+
+# AI readiness: score thresholds (ascending) and the level for each band
+READINESS_THRESHOLDS = (50, 75)
+READINESS_LEVELS = ("low", "medium", "high")
+
+# Navigation keywords per content section (matched as substrings)
+NAV_SECTION_KEYWORDS = {
+    "has_blog": frozenset({"blog", "news", "articles"}),
+    "has_docs": frozenset(
+        {"docs", "documentation", "help", "support", "guide", "learn"}
+    ),
+    "has_resources": frozenset({"resource", "library", "faq"}),
+    "has_about": frozenset({"about", "company", "team"}),
+}
+
+_NAV_KEYWORD_SECTIONS = {
+    keyword: section
+    for section, keywords in NAV_SECTION_KEYWORDS.items()
+    for keyword in keywords
+}
+
+# One pass over all nav labels; the lookahead reports overlapping matches so
+# this is equivalent to running `keyword in label` for every keyword.
+_NAV_KEYWORD_PATTERN = re.compile(
+    "(?=("
+    + "|".join(map(re.escape, sorted(_NAV_KEYWORD_SECTIONS, key=len, reverse=True)))
+    + "))"
+)
+
+# Title separators in priority order: " - ", " | ", " — ", ":". Alternatives
+# of an anchored pattern are tried in order, so this matches the text before
+# the first occurrence of the highest-priority separator present.
+_TITLE_BRAND_PATTERN = re.compile(r"^(?:(.*?) - |(.*?) \| |(.*?) — |(.*?):)", re.DOTALL)
+
+
+# Text size above which content depth is analyzed in a worker thread
+CONTENT_THREAD_MIN_CHARS = 50000
+
+# Fallback from _get_brand_name when nothing identifies the brand
+UNKNOWN_BRAND = "Unknown Brand"
+
+
+def _is_searchable_brand(brand_name: str) -> bool:
+    """Whether a resolved brand name is worth looking up externally."""
+    return brand_name != UNKNOWN_BRAND and len(brand_name.strip()) >= 2
+
+
+def _as_list(value: Any) -> List[Any]:
+    """Wrap a single JSON-LD value in a list; lists are returned as-is."""
+    return value if isinstance(value, list) else [value]
+
+
+def _count_long_paragraphs(text: str, min_length: int = 100) -> int:
+    """
+    Count blank-line separated paragraphs longer than min_length characters.
+
+    Equivalent to len([p for p in text.split("\\n\\n") if len(p) > min_length])
+    but walks the separators with str.find instead of building the list.
+    """
+    count = 0
+    start = 0
+    while True:
+        end = text.find("\n\n", start)
+        if end == -1:
+            return count + (len(text) - start > min_length)
+        if end - start > min_length:
+            count += 1
+        start = end + 2
+
+
+# =============================================================================
+# Static Findings & Recommendations
+# =============================================================================
+# These don't depend on analysis data. Finding and Recommendation are frozen,
+# so every analysis shares the same instances instead of rebuilding them.
+# Templates with fixed text but per-analysis data are copied with model_copy,
+# which attaches the data without re-validating the static fields.
+# =============================================================================
+
+BRAND_NOT_DETECTED_FINDING = Finding(
+    title="Brand Name Not Detected",
+    detail="We couldn't determine your brand name from the website, so Wikipedia and "
+    "search visibility weren't checked. Make sure your homepage title or "
+    "Organization schema states your brand name clearly.",
+    severity=SeverityLevel.MEDIUM,
+)
+
+WIKIPEDIA_PAGE_FINDING = Finding(
+    title="Wikipedia Page Found",
+    detail="Your brand has a Wikipedia page, which significantly improves AI discoverability. "
+    "AI assistants often cite Wikipedia as an authoritative source.",
+    severity=SeverityLevel.INFO,
+)
+
+NO_WIKIPEDIA_FINDING = Finding(
+    title="No Wikipedia Presence",
+    detail="No Wikipedia page or mentions found for your brand. AI assistants may have "
+    "limited information about your company. Consider working toward Wikipedia notability.",
+    severity=SeverityLevel.MEDIUM,
+)
+
+MISSING_ORGANIZATION_SCHEMA_FINDING = Finding(
+    title="Missing Organization Schema",
+    detail="No Organization or Corporation schema found. This is the most important "
+    "structured data for brand identification by AI systems.",
+    severity=SeverityLevel.MEDIUM,
+)
+
+NO_SCHEMA_FINDING = Finding(
+    title="No Structured Data Found",
+    detail="No Schema.org markup detected on your website. Structured data helps AI and "
+    "search engines understand your content better, enabling rich results.",
+    severity=SeverityLevel.MEDIUM,
+)
+
+WEAK_SERP_FINDING = Finding(
+    title="Weak SERP Position",
+    detail="Your brand doesn't appear in the top 10 search results for your brand name. "
+    "This may indicate SEO issues or brand name conflicts.",
+    severity=SeverityLevel.HIGH,
+)
+
+LIMITED_CONTENT_FINDING = Finding(
+    title="Limited Content Depth",
+    detail="Your website has limited content depth. AI systems favor websites with "
+    "substantial, authoritative content. Consider adding a blog, documentation, "
+    "or resource center.",
+    severity=SeverityLevel.MEDIUM,
+)
+
+WIKIPEDIA_NOTABILITY_REC = Recommendation(
+    title="Work Toward Wikipedia Notability",
+    description="Getting a Wikipedia page significantly boosts AI discoverability. Focus on: "
+    "1) Getting coverage in reliable sources (press, industry publications), "
+    "2) Building notable achievements or milestones, "
+    "3) Ensuring your company information is verifiable from independent sources. "
+    "Note: Don't create your own Wikipedia page - that's against their policies.",
+    priority=SeverityLevel.MEDIUM,
+    category="ai_discoverability",
+    impact="high",
+    effort="high",
+)
+
+ORGANIZATION_SCHEMA_REC = Recommendation(
+    title="Add Organization Schema",
+    description="Implement Organization schema markup on your homepage. Include: name, logo, "
+    "url, description, social profiles, founding date, and founders. This helps "
+    "AI systems accurately identify and describe your brand.",
+    priority=SeverityLevel.HIGH,
+    category="ai_discoverability",
+    impact="high",
+    effort="low",
+)
+
+FAQ_SCHEMA_REC = Recommendation(
+    title="Add FAQ Schema",
+    description="Create an FAQ section with Schema.org FAQPage markup. FAQ content is "
+    "directly consumed by AI assistants when answering questions about your "
+    "brand or industry. Focus on common questions your customers ask.",
+    priority=SeverityLevel.MEDIUM,
+    category="ai_discoverability",
+    impact="medium",
+    effort="low",
+)
+
+PUBLISH_CONTENT_REC = Recommendation(
+    title="Start Publishing Content",
+    description="Create a blog or resource center with in-depth articles about your industry. "
+    "AI systems are trained on web content, so publishing authoritative articles "
+    "increases the chance of AI assistants knowing about and recommending your brand.",
+    priority=SeverityLevel.MEDIUM,
+    category="ai_discoverability",
+    impact="high",
+    effort="medium",
+)
+
+DOCUMENTATION_REC = Recommendation(
+    title="Create Comprehensive Documentation",
+    description="Build detailed documentation or help content. This signals expertise and "
+    "provides AI systems with accurate information about your products/services. "
+    "Consider creating how-to guides, use cases, and detailed product descriptions.",
+    priority=SeverityLevel.LOW,
+    category="ai_discoverability",
+    impact="medium",
+    effort="medium",
+)
 
 
 class AIDiscoverabilityAnalyzer(BaseAnalyzer):
@@ -38,11 +250,14 @@ class AIDiscoverabilityAnalyzer(BaseAnalyzer):
     Analyzes AI Discoverability (AEO - Answer Engine Optimization).
     """
 
+    __slots__ = ()
+
     MODULE_NAME = "ai_discoverability"
     WEIGHT = 0.10
 
     async def analyze(self) -> AnalyzerResult:
         """Run the AI discoverability analysis."""
+        content_task = None
         try:
             self._raw_data = {}
 
@@ -50,31 +265,68 @@ class AIDiscoverabilityAnalyzer(BaseAnalyzer):
             brand_name = self._get_brand_name()
             self._raw_data["brand_name"] = brand_name
 
+            # On large pages the content depth scan takes long enough to stall
+            # other analyzers sharing the event loop, so start it in a worker
+            # thread now and collect it once the lookups are done.
+            text_content = self.scraped_data.get("text_content") or ""
+            if len(text_content) > CONTENT_THREAD_MIN_CHARS:
+                content_task = asyncio.ensure_future(
+                    asyncio.to_thread(self._analyze_content_depth)
+                )
+
             # ----------------------------------------------------------------
-            # 1. Check Wikipedia presence
+            # 1 & 2. Check Wikipedia presence and SERP visibility
             # ----------------------------------------------------------------
-            # Wikipedia is the primary "fact source" for most LLMs.
-            wiki_service = WikipediaService()
-            wiki_presence = await wiki_service.check_brand_presence(brand_name)
-            self._raw_data["wikipedia"] = {
+            # Wikipedia is the primary "fact source" for most LLMs, and if
+            # Google trusts you (Knowledge Panel), AI likely trusts you too.
+            # The lookups are independent, so run them concurrently; a failure
+            # in one must not discard the other's result.
+            from app.services.wikipedia_service import (
+                WikipediaService,
+                WikipediaPresence,
+            )
+
+            if not _is_searchable_brand(brand_name):
+                # Lookups for a placeholder name only return noise, so skip
+                # both round-trips and score the on-site signals alone
+                self._raw_data["brand_detected"] = False
+                wiki_presence = WikipediaPresence(
+                    success=False,
+                    brand_name=brand_name,
+                    error="Brand name not detected",
+                )
+                serp_data = {"available": False, "error": "Brand name not detected"}
+            else:
+                wiki_service = WikipediaService()
+                wiki_presence, serp_data = await asyncio.gather(
+                    wiki_service.check_brand_presence(brand_name),
+                    self._check_serp_visibility(brand_name),
+                    return_exceptions=True,
+                )
+            if isinstance(wiki_presence, Exception):
+                wiki_presence = WikipediaPresence(
+                    success=False,
+                    brand_name=brand_name,
+                    error=str(wiki_presence),
+                )
+            if isinstance(serp_data, Exception):
+                serp_data = {"available": False, "error": str(serp_data)}
+
+            article = wiki_presence.article
+            wiki = self._raw_data["wikipedia"] = {
+                "available": wiki_presence.success,
+                "error": wiki_presence.error,
                 "exists": wiki_presence.has_wikipedia_page,
-                "url": wiki_presence.article.url if wiki_presence.article else None,
-                "description": wiki_presence.article.description
-                if wiki_presence.article
-                else None,
-                "extract": wiki_presence.article.extract[:500]
-                if wiki_presence.article and wiki_presence.article.extract
-                else None,
+                "url": article.url if article else None,
+                "description": article.description if article else None,
+                "extract": (
+                    article.extract[:500] if article and article.extract else None
+                ),
                 "notability_score": wiki_presence.notability_score,
                 "signals": wiki_presence.signals,
                 "mentioned_in": wiki_presence.mentioned_in_other_articles,
             }
 
-            # ----------------------------------------------------------------
-            # 2. Check SERP visibility
-            # ----------------------------------------------------------------
-            # If Google trusts you (Knowledge Panel), AI likely trusts you too.
-            serp_data = await self._check_serp_visibility(brand_name)
             self._raw_data["serp"] = serp_data
 
             # ----------------------------------------------------------------
@@ -88,7 +340,10 @@ class AIDiscoverabilityAnalyzer(BaseAnalyzer):
             # 4. Analyze content depth
             # ----------------------------------------------------------------
             # More high-quality text = higher chance of being in training data.
-            content = self._analyze_content_depth()
+            if content_task is not None:
+                content = await content_task
+            else:
+                content = self._analyze_content_depth()
             self._raw_data["content_depth"] = content
 
             # ----------------------------------------------------------------
@@ -109,30 +364,24 @@ class AIDiscoverabilityAnalyzer(BaseAnalyzer):
                 "score": score,
                 "brand_name": brand_name,
                 # Wikipedia
-                "has_wikipedia_page": wiki_presence.has_wikipedia_page,
-                "wikipedia_url": wiki_presence.article.url
-                if wiki_presence.article
-                else None,
-                "wikipedia_description": wiki_presence.article.description
-                if wiki_presence.article
-                else None,
-                "wikipedia_notability_score": wiki_presence.notability_score,
-                "mentioned_in_wikipedia_articles": len(
-                    wiki_presence.mentioned_in_other_articles
-                ),
+                "has_wikipedia_page": wiki["exists"],
+                "wikipedia_url": wiki["url"],
+                "wikipedia_description": wiki["description"],
+                "wikipedia_notability_score": wiki["notability_score"],
+                "mentioned_in_wikipedia_articles": len(wiki["mentioned_in"]),
                 # SERP
                 "brand_in_top_10": serp_data.get("brand_in_top_10", False),
                 "serp_position": serp_data.get("brand_position"),
                 "has_knowledge_panel": serp_data.get("knowledge_panel_likely", False),
                 # Schema
-                "has_faq_schema": "FAQPage" in schema.get("types", []),
-                "has_organization_schema": "Organization" in schema.get("types", []),
-                "schema_types": schema.get("types", []),
-                "schema_count": schema.get("count", 0),
+                "has_faq_schema": schema["has_faq"],
+                "has_organization_schema": "Organization" in schema["types"],
+                "schema_types": schema["types"],
+                "schema_count": schema["count"],
                 # Content depth
-                "has_blog": content.get("has_blog", False),
-                "has_documentation": content.get("has_docs", False),
-                "content_depth_score": content.get("score", 0),
+                "has_blog": content["has_blog"],
+                "has_documentation": content["has_docs"],
+                "content_depth_score": content["score"],
                 # Overall assessment
                 "ai_readiness_level": self._get_readiness_level(score),
             }
@@ -145,10 +394,18 @@ class AIDiscoverabilityAnalyzer(BaseAnalyzer):
             )
 
         except Exception as e:
-            return AnalyzerResult(
-                score=0,
-                error=f"AI Discoverability analysis failed: {str(e)}",
+            return AnalyzerResult.failure(
+                f"AI Discoverability analysis failed: {str(e)}"
             )
+        finally:
+            # A step that failed (or a timeout) before the content scan was
+            # collected leaves its task behind: cancel it, or retrieve its
+            # outcome so asyncio doesn't log an unretrieved exception.
+            if content_task is not None:
+                if not content_task.done():
+                    content_task.cancel()
+                elif not content_task.cancelled():
+                    content_task.exception()
 
     def _get_brand_name(self) -> str:
         """Extract brand name from scraped data or URL."""
@@ -161,9 +418,9 @@ class AIDiscoverabilityAnalyzer(BaseAnalyzer):
         title = self.scraped_data.get("title", "")
         if title:
             # Often title is "Brand Name - Tagline" or "Brand Name | Description"
-            for sep in [" - ", " | ", " — ", ":"]:
-                if sep in title:
-                    return title.split(sep)[0].strip()
+            match = _TITLE_BRAND_PATTERN.match(title)
+            if match:
+                return match.group(match.lastindex).strip()
 
         # Fall back to domain name
         domain = getattr(self, "domain", self.url)
@@ -173,7 +430,7 @@ class AIDiscoverabilityAnalyzer(BaseAnalyzer):
             # Capitalize
             return name.capitalize()
 
-        return "Unknown Brand"
+        return UNKNOWN_BRAND
 
     async def _check_serp_visibility(self, brand_name: str) -> Dict[str, Any]:
         """Check brand visibility in search results."""
@@ -187,9 +444,14 @@ class AIDiscoverabilityAnalyzer(BaseAnalyzer):
                 "knowledge_panel_likely": False,
             }
 
+        from app.services.google_search_service import GoogleSearchService
+
         try:
             search_service = GoogleSearchService()
             serp = await search_service.search_brand(brand_name, self.domain)
+            if not serp.success:
+                # Rate limited or refused: no ranking data, not a poor ranking
+                return {"available": False, "error": serp.error}
 
             return {
                 "available": True,
@@ -210,71 +472,65 @@ class AIDiscoverabilityAnalyzer(BaseAnalyzer):
         """Analyze Schema.org structured data on the website."""
         schemas = self.scraped_data.get("schema_markup", [])
 
-        types = []
-        for schema in schemas:
-            if isinstance(schema, dict):
-                schema_type = schema.get("@type", "")
-                if schema_type and schema_type not in types:
-                    types.append(schema_type)
+        # Unique types in first-seen order. JSON-LD allows a list of types
+        # on one node, so those are flattened rather than kept as lists.
+        types = list(
+            dict.fromkeys(
+                schema_type
+                for schema in schemas
+                if isinstance(schema, dict)
+                for schema_type in _as_list(schema.get("@type"))
+                if schema_type and isinstance(schema_type, str)
+            )
+        )
 
         # Check for recommended schema types
-        has_organization = "Organization" in types or "Corporation" in types
-        has_faq = "FAQPage" in types
-        has_product = "Product" in types or "SoftwareApplication" in types
-        has_article = "Article" in types or "BlogPosting" in types
-        has_breadcrumb = "BreadcrumbList" in types
+        type_set = set(types)
+        flags = {
+            flag: not accepted.isdisjoint(type_set)
+            for flag, accepted, _ in SCHEMA_GROUPS
+        }
 
         # Calculate schema score
-        schema_score = 0
-        if has_organization:
-            schema_score += 30
-        if has_faq:
-            schema_score += 20
-        if has_product:
-            schema_score += 15
-        if has_article:
-            schema_score += 15
-        if has_breadcrumb:
-            schema_score += 10
+        schema_score = sum(points for flag, _, points in SCHEMA_GROUPS if flags[flag])
         if len(types) > 3:
             schema_score += 10
 
         return {
             "types": types,
             "count": len(schemas),
-            "has_organization": has_organization,
-            "has_faq": has_faq,
-            "has_product": has_product,
-            "has_article": has_article,
+            "has_organization": flags["has_organization"],
+            "has_faq": flags["has_faq"],
+            "has_product": flags["has_product"],
+            "has_article": flags["has_article"],
             "schema_score": min(100, schema_score),
         }
 
     def _analyze_content_depth(self) -> Dict[str, Any]:
         """Analyze content depth for AI indexing potential."""
-        # Check navigation for content sections
+        # Check navigation for content sections in a single scan
         nav = self.scraped_data.get("navigation", [])
-        nav_texts = [n.get("text", "").lower() for n in nav if isinstance(n, dict)]
-
-        # Check for common content sections
-        has_blog = any("blog" in t or "news" in t or "articles" in t for t in nav_texts)
-        has_docs = any(
-            d in t
-            for t in nav_texts
-            for d in ["docs", "documentation", "help", "support", "guide", "learn"]
-        )
-        has_resources = any(
-            "resource" in t or "library" in t or "faq" in t for t in nav_texts
-        )
-        has_about = any(
-            "about" in t or "company" in t or "team" in t for t in nav_texts
+        nav_text = "\n".join(
+            (n.get("text") or "").lower() for n in nav if isinstance(n, dict)
         )
+        sections = set()
+        for match in _NAV_KEYWORD_PATTERN.finditer(nav_text):
+            sections.add(_NAV_KEYWORD_SECTIONS[match.group(1)])
+            # Stop early once every section has been seen
+            if len(sections) == len(NAV_SECTION_KEYWORDS):
+                break
+
+        has_blog = "has_blog" in sections
+        has_docs = "has_docs" in sections
+        has_resources = "has_resources" in sections
+        has_about = "has_about" in sections
 
         # Analyze content length
         word_count = self.scraped_data.get("word_count", 0)
         text_content = self.scraped_data.get("text_content", "")
 
         # Count paragraphs
-        paragraphs = len([p for p in text_content.split("\n\n") if len(p) > 100])
+        paragraphs = _count_long_paragraphs(text_content)
 
         # Calculate content depth score (0-10)
         score = 0
@@ -313,58 +569,53 @@ class AIDiscoverabilityAnalyzer(BaseAnalyzer):
 
     def _get_readiness_level(self, score: float) -> str:
         """Determine AI readiness level based on score."""
-        if score >= 75:
-            return "high"
-        elif score >= 50:
-            return "medium"
-        else:
-            return "low"
+        return READINESS_LEVELS[bisect_right(READINESS_THRESHOLDS, score)]
 
     def _calculate_score(self) -> float:
         """
         Calculate the overall AI discoverability score.
         """
-        score = 0.0
+        raw = self._raw_data
+        wiki = raw.get("wikipedia") or {}
+        serp = raw.get("serp") or {}
+        wiki_exists = wiki.get("exists")
 
         # Wikipedia presence (30%)
         # It's hard to get, but extremely valuable for AI trust
-        wiki = self._raw_data.get("wikipedia", {})
-        if wiki.get("exists"):
+        if wiki_exists:
             # Full Wikipedia page
-            notability = wiki.get("notability_score", 50)
-            score += (notability / 100) * 30
-        elif wiki.get("mentioned_in"):
+            wiki_points = wiki.get("notability_score", 50) / 100 * SCORE_WEIGHTS[0]
+        else:
             # Mentioned in other articles (better than nothing)
-            score += min(15, len(wiki.get("mentioned_in", [])) * 5)
+            wiki_points = min(15, len(wiki.get("mentioned_in") or ()) * 5)
 
-        # Structured data (25%)
-        # Easy technical win
-        schema = self._raw_data.get("schema", {})
-        schema_score = schema.get("schema_score", 0)
-        score += (schema_score / 100) * 25
+        # Structured data (25%) - easy technical win
+        schema_points = (
+            (raw.get("schema") or {}).get("schema_score", 0) / 100 * SCORE_WEIGHTS[1]
+        )
 
-        # Content depth (20%)
-        # AI feeds on text
-        content = self._raw_data.get("content_depth", {})
-        content_score = content.get("score", 0)
-        score += (content_score / 10) * 20
+        # Content depth (20%) - AI feeds on text
+        content_points = (
+            (raw.get("content_depth") or {}).get("score", 0) / 10 * SCORE_WEIGHTS[2]
+        )
 
-        # SERP visibility (15%)
-        serp = self._raw_data.get("serp", {})
-        if serp.get("brand_in_top_3"):
-            score += 15
-        elif serp.get("brand_in_top_10"):
-            score += 10
-        elif serp.get("brand_position"):
-            score += 5
-
-        # Knowledge panel (10%)
-        if serp.get("knowledge_panel_likely"):
-            score += 10
-        elif wiki.get("exists"):
-            score += 5  # Likely to have knowledge panel with Wikipedia
+        # SERP visibility (15%): best tier reached wins
+        serp_tier = max(
+            3 * bool(serp.get("brand_in_top_3")),
+            2 * bool(serp.get("brand_in_top_10")),
+            bool(serp.get("brand_position")),
+        )
+        serp_points = SERP_TIER_POINTS[serp_tier]
 
-        return self.clamp_score(score)
+        # Knowledge panel (10%); a Wikipedia page makes one likely
+        panel_tier = max(
+            2 * bool(serp.get("knowledge_panel_likely")), bool(wiki_exists)
+        )
+        panel_points = PANEL_TIER_POINTS[panel_tier]
+
+        return self.clamp_score(
+            wiki_points + schema_points + content_points + serp_points + panel_points
+        )
 
     def _generate_findings(self) -> List[Finding]:
         """Generate findings based on the analysis."""
@@ -376,67 +627,51 @@ class AIDiscoverabilityAnalyzer(BaseAnalyzer):
         content = self._raw_data.get("content_depth", {})
 
         # Wikipedia findings
-        if wiki.get("exists"):
+        if not self._raw_data.get("brand_detected", True):
+            findings.append(BRAND_NOT_DETECTED_FINDING)
+        elif wiki.get("exists"):
             findings.append(
-                Finding(
-                    title="Wikipedia Page Found",
-                    detail="Your brand has a Wikipedia page, which significantly improves AI discoverability. "
-                    "AI assistants often cite Wikipedia as an authoritative source.",
-                    severity=SeverityLevel.INFO,
-                    data={
-                        "url": wiki.get("url"),
-                        "description": wiki.get("description"),
-                    },
+                WIKIPEDIA_PAGE_FINDING.model_copy(
+                    update={
+                        "data": {
+                            "url": wiki.get("url"),
+                            "description": wiki.get("description"),
+                        }
+                    }
                 )
             )
         elif wiki.get("mentioned_in"):
+            mentioned_in = wiki["mentioned_in"]
             findings.append(
                 Finding(
                     title="Mentioned in Wikipedia",
-                    detail=f"Your brand is mentioned in {len(wiki.get('mentioned_in', []))} Wikipedia articles, "
+                    detail=f"Your brand is mentioned in {len(mentioned_in)} Wikipedia articles, "
                     f"but doesn't have a dedicated page. This provides some discoverability.",
-                    severity=SeverityLevel.LOW,
-                    data={"articles": wiki.get("mentioned_in", [])[:3]},
+                    severity=_LOW,
+                    data={"articles": mentioned_in[:3]},
                 )
             )
         else:
-            findings.append(
-                Finding(
-                    title="No Wikipedia Presence",
-                    detail="No Wikipedia page or mentions found for your brand. AI assistants may have "
-                    "limited information about your company. Consider working toward Wikipedia notability.",
-                    severity=SeverityLevel.MEDIUM,
-                )
-            )
+            findings.append(NO_WIKIPEDIA_FINDING)
 
         # Schema findings
+        schema_types = schema.get("types", [])
         if schema.get("count", 0) == 0:
-            findings.append(
-                Finding(
-                    title="No Structured Data Found",
-                    detail="No Schema.org markup detected on your website. Structured data helps AI and "
-                    "search engines understand your content better, enabling rich results.",
-                    severity=SeverityLevel.MEDIUM,
-                )
-            )
+            findings.append(NO_SCHEMA_FINDING)
         elif not schema.get("has_organization"):
             findings.append(
-                Finding(
-                    title="Missing Organization Schema",
-                    detail="No Organization or Corporation schema found. This is the most important "
-                    "structured data for brand identification by AI systems.",
-                    severity=SeverityLevel.MEDIUM,
-                    data={"current_schemas": schema.get("types", [])},
+                MISSING_ORGANIZATION_SCHEMA_FINDING.model_copy(
+                    update={"data": {"current_schemas": schema_types}}
                 )
             )
         else:
-            types_count = len(schema.get("types", []))
+            types_count = len(schema_types)
             findings.append(
                 Finding(
                     title=f"Structured Data Present ({types_count} types)",
-                    detail=f"Found {types_count} schema types: {', '.join(schema.get('types', [])[:5])}. "
+                    detail=f"Found {types_count} schema types: {', '.join(schema_types[:5])}. "
                     f"This helps AI understand your content.",
-                    severity=SeverityLevel.INFO,
+                    severity=_INFO,
                 )
             )
 
@@ -448,30 +683,15 @@ class AIDiscoverabilityAnalyzer(BaseAnalyzer):
                         title="Strong SERP Position",
                         detail=f"Your brand ranks in the top 3 for brand name searches (position {serp.get('brand_position')}). "
                         f"This indicates strong search visibility.",
-                        severity=SeverityLevel.INFO,
+                        severity=_INFO,
                     )
                 )
             elif not serp.get("brand_in_top_10"):
-                findings.append(
-                    Finding(
-                        title="Weak SERP Position",
-                        detail="Your brand doesn't appear in the top 10 search results for your brand name. "
-                        "This may indicate SEO issues or brand name conflicts.",
-                        severity=SeverityLevel.HIGH,
-                    )
-                )
+                findings.append(WEAK_SERP_FINDING)
 
         # Content depth findings
         if content.get("score", 0) <= 3:
-            findings.append(
-                Finding(
-                    title="Limited Content Depth",
-                    detail="Your website has limited content depth. AI systems favor websites with "
-                    "substantial, authoritative content. Consider adding a blog, documentation, "
-                    "or resource center.",
-                    severity=SeverityLevel.MEDIUM,
-                )
-            )
+            findings.append(LIMITED_CONTENT_FINDING)
 
         return findings
 
@@ -485,77 +705,20 @@ class AIDiscoverabilityAnalyzer(BaseAnalyzer):
 
         # Wikipedia recommendation
         if not wiki.get("exists"):
-            recommendations.append(
-                Recommendation(
-                    title="Work Toward Wikipedia Notability",
-                    description="Getting a Wikipedia page significantly boosts AI discoverability. Focus on: "
-                    "1) Getting coverage in reliable sources (press, industry publications), "
-                    "2) Building notable achievements or milestones, "
-                    "3) Ensuring your company information is verifiable from independent sources. "
-                    "Note: Don't create your own Wikipedia page - that's against their policies.",
-                    priority=SeverityLevel.MEDIUM,
-                    category="ai_discoverability",
-                    impact="high",
-                    effort="high",
-                )
-            )
+            recommendations.append(WIKIPEDIA_NOTABILITY_REC)
 
         # Schema recommendations
         if not schema.get("has_organization"):
-            recommendations.append(
-                Recommendation(
-                    title="Add Organization Schema",
-                    description="Implement Organization schema markup on your homepage. Include: name, logo, "
-                    "url, description, social profiles, founding date, and founders. This helps "
-                    "AI systems accurately identify and describe your brand.",
-                    priority=SeverityLevel.HIGH,
-                    category="ai_discoverability",
-                    impact="high",
-                    effort="low",
-                )
-            )
+            recommendations.append(ORGANIZATION_SCHEMA_REC)
 
         if not schema.get("has_faq"):
-            recommendations.append(
-                Recommendation(
-                    title="Add FAQ Schema",
-                    description="Create an FAQ section with Schema.org FAQPage markup. FAQ content is "
-                    "directly consumed by AI assistants when answering questions about your "
-                    "brand or industry. Focus on common questions your customers ask.",
-                    priority=SeverityLevel.MEDIUM,
-                    category="ai_discoverability",
-                    impact="medium",
-                    effort="low",
-                )
-            )
+            recommendations.append(FAQ_SCHEMA_REC)
 
         # Content recommendations
         if not content.get("has_blog"):
-            recommendations.append(
-                Recommendation(
-                    title="Start Publishing Content",
-                    description="Create a blog or resource center with in-depth articles about your industry. "
-                    "AI systems are trained on web content, so publishing authoritative articles "
-                    "increases the chance of AI assistants knowing about and recommending your brand.",
-                    priority=SeverityLevel.MEDIUM,
-                    category="ai_discoverability",
-                    impact="high",
-                    effort="medium",
-                )
-            )
+            recommendations.append(PUBLISH_CONTENT_REC)
 
         if not content.get("has_docs") and content.get("word_count", 0) < 1000:
-            recommendations.append(
-                Recommendation(
-                    title="Create Comprehensive Documentation",
-                    description="Build detailed documentation or help content. This signals expertise and "
-                    "provides AI systems with accurate information about your products/services. "
-                    "Consider creating how-to guides, use cases, and detailed product descriptions.",
-                    priority=SeverityLevel.LOW,
-                    category="ai_discoverability",
-                    impact="medium",
-                    effort="medium",
-                )
-            )
+            recommendations.append(DOCUMENTATION_REC)
 
         return recommendations
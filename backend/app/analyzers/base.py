@@ -6,13 +6,48 @@
 # =============================================================================
 
 from abc import ABC, abstractmethod
-from typing import List, Dict, Any, Optional, Callable, Awaitable
+from bisect import bisect_right
+from functools import lru_cache
+import math
+from typing import List, Dict, Any, Optional, Callable, Awaitable, Sequence
 from dataclasses import dataclass, field
+from urllib.parse import urlparse
 
 from app.models.report import Finding, Recommendation, SeverityLevel
 
+# Rating bands for score_to_rating: ascending thresholds and their labels
+RATING_THRESHOLDS = (40, 60, 75, 90)
+RATING_LEVELS = ("critical", "poor", "fair", "good", "excellent")
 
-@dataclass
+# scraped_data key holding lowercased copies of its text fields
+LOWERCASE_CONTENT_KEY = "_lowercase"
+
+
+@lru_cache(maxsize=1024)
+def extract_domain(url: str) -> str:
+    """
+    Extract the domain from a URL, without a leading "www.".
+
+    Every analyzer in a run is built from the same URL, so results are
+    memoized and only the first call per URL parses it.
+
+    Args:
+        url: Full URL (e.g., https://www.example.com/page)
+
+    Returns:
+        str: Domain (e.g., example.com)
+    """
+    parsed = urlparse(url)
+    domain = parsed.netloc or parsed.path
+
+    # Remove www. prefix if present
+    if domain.startswith("www."):
+        domain = domain[4:]
+
+    return domain
+
+
+@dataclass(slots=True)
 class AnalyzerResult:
     """
     Standard result container for all analyzers.
@@ -32,11 +67,27 @@ class AnalyzerResult:
     """
 
     score: float = 0.0
-    findings: List[Finding] = field(default_factory=list)
-    recommendations: List[Recommendation] = field(default_factory=list)
+    findings: Sequence[Finding] = field(default_factory=list)
+    recommendations: Sequence[Recommendation] = field(default_factory=list)
     data: Dict[str, Any] = field(default_factory=dict)
     error: Optional[str] = None
 
+    @classmethod
+    def failure(cls, error: str) -> "AnalyzerResult":
+        """
+        Build the result for a failed analysis.
+
+        Failed results never gain findings or recommendations, so they share
+        the empty tuple instead of allocating two fresh lists.
+
+        Args:
+            error: Why the analysis failed
+
+        Returns:
+            AnalyzerResult: Zero-score result carrying the error
+        """
+        return cls(findings=(), recommendations=(), error=error)
+
     def is_success(self) -> bool:
         """Check if the analysis completed successfully."""
         return self.error is None
@@ -65,6 +116,19 @@ class BaseAnalyzer(ABC):
         scraped_data: Shared scraped website data
     """
 
+    # Instance attributes live in fixed slots rather than a per-instance
+    # __dict__. Subclasses declare an empty __slots__ to keep that saving.
+    __slots__ = (
+        "_findings",
+        "_raw_data",
+        "_recommendations",
+        "description",
+        "domain",
+        "industry",
+        "scraped_data",
+        "url",
+    )
+
     # -------------------------------------------------------------------------
     # Class-level configuration
     # -------------------------------------------------------------------------
@@ -184,16 +248,7 @@ class BaseAnalyzer(ABC):
         Returns:
             str: Domain (e.g., example.com)
         """
-        from urllib.parse import urlparse
-
-        parsed = urlparse(url)
-        domain = parsed.netloc or parsed.path
-
-        # Remove www. prefix if present
-        if domain.startswith("www."):
-            domain = domain[4:]
-
-        return domain
+        return extract_domain(url)
 
     def add_finding(
         self,
@@ -262,6 +317,25 @@ class BaseAnalyzer(ABC):
         """
         return self.scraped_data.get(key, default)
 
+    def get_lowercase_content(self, key: str) -> str:
+        """
+        Get a lowercased copy of a text field of the shared scraped data.
+
+        All analyzers of a run share one scraped_data dict, so the copy is
+        stored alongside it and each field ("html", "text_content", ...) is
+        lowercased once per analysis rather than once per check.
+
+        Args:
+            key: Key of a text field in the scraped data
+
+        Returns:
+            The lowercased text, or "" if the field is missing
+        """
+        lowered = self.scraped_data.setdefault(LOWERCASE_CONTENT_KEY, {})
+        if key not in lowered:
+            lowered[key] = (self.scraped_data.get(key) or "").lower()
+        return lowered[key]
+
     @staticmethod
     def clamp_score(score: float) -> float:
         """
@@ -273,7 +347,9 @@ class BaseAnalyzer(ABC):
         Returns:
             float: Score clamped to 0-100
         """
-        return max(0.0, min(100.0, score))
+        # Same results as max(0.0, min(100.0, score)), including 0.0/100.0 at
+        # the bounds and 100.0 for NaN, without the two builtin calls
+        return 0.0 if score <= 0.0 else score if score < 100.0 else 100.0
 
     @staticmethod
     def score_to_rating(score: float) -> str:
@@ -286,22 +362,17 @@ class BaseAnalyzer(ABC):
         Returns:
             str: Rating (excellent/good/fair/poor/critical)
         """
-        if score >= 90:
-            return "excellent"
-        elif score >= 75:
-            return "good"
-        elif score >= 60:
-            return "fair"
-        elif score >= 40:
-            return "poor"
-        else:
-            return "critical"
+        # NaN compares false against every threshold, which bisect would read
+        # as above them all; treat it as the lowest band instead
+        if math.isnan(score):
+            return RATING_LEVELS[0]
+        return RATING_LEVELS[bisect_right(RATING_THRESHOLDS, score)]
 
 
 # =============================================================================
 # Analysis Context
 # =============================================================================
-@dataclass
+@dataclass(slots=True)
 class AnalysisContext:
     """
     Shared context passed to all analyzers.
@@ -24,7 +24,18 @@
 # - Tone Consistency (20%): Do you sound the same everywhere?
 # =============================================================================
 
-from typing import Dict, Any, List
+from typing import (
+    Any,
+    Dict,
+    List,
+    Mapping,
+    Optional,
+    Tuple,
+)
+from types import MappingProxyType
+from collections import Counter
+from functools import lru_cache
+import asyncio
 import textstat
 
 from app.config import settings
@@ -35,101 +46,205 @@ from app.models.report import (
     SeverityLevel,
 )
 from app.services.openai_service import OpenAIService
+from app.utils.nlp import keyword_matcher, word_tokens
 
 
-class BrandMessagingAnalyzer(BaseAnalyzer):
-    """
-    Analyzes Brand Messaging & Archetype.
-    """
-
-    MODULE_NAME = "brand_messaging"
-    WEIGHT = 0.15
+# =============================================================================
+# Brand Archetypes
+# =============================================================================
 
-    # The 12 Brand Archetypes (Jungian)
-    # These provide a framework for consistent storytelling.
-    ARCHETYPES = {
+# The 12 Brand Archetypes (Jungian)
+# These provide a framework for consistent storytelling.
+ARCHETYPES: Mapping[str, Dict[str, Any]] = MappingProxyType(
+    {
         "hero": {
             "description": "Seeks to prove worth through courage and determination",
-            "keywords": ["win", "power", "strength", "champion", "courage", "overcome"],
-            "examples": ["Nike", "FedEx", "BMW"],
+            "keywords": ("win", "power", "strength", "champion", "courage", "overcome"),
+            "examples": ("Nike", "FedEx", "BMW"),
         },
         "outlaw": {
             "description": "Seeks revolution and breaking rules",
-            "keywords": [
+            "keywords": (
                 "rebel",
                 "disrupt",
                 "revolution",
                 "break",
                 "freedom",
                 "change",
-            ],
-            "examples": ["Harley-Davidson", "Virgin", "Diesel"],
+            ),
+            "examples": ("Harley-Davidson", "Virgin", "Diesel"),
         },
         "magician": {
             "description": "Makes dreams come true through transformation",
-            "keywords": ["transform", "magic", "vision", "dream", "imagine", "create"],
-            "examples": ["Apple", "Disney", "Tesla"],
+            "keywords": ("transform", "magic", "vision", "dream", "imagine", "create"),
+            "examples": ("Apple", "Disney", "Tesla"),
         },
         "everyman": {
             "description": "Seeks belonging and connection",
-            "keywords": ["belong", "honest", "real", "friendly", "everyday", "trust"],
-            "examples": ["IKEA", "eBay", "Target"],
+            "keywords": ("belong", "honest", "real", "friendly", "everyday", "trust"),
+            "examples": ("IKEA", "eBay", "Target"),
         },
         "lover": {
             "description": "Seeks intimacy and sensory pleasure",
-            "keywords": [
+            "keywords": (
                 "passion",
                 "beauty",
                 "intimacy",
                 "sensual",
                 "desire",
                 "luxury",
-            ],
-            "examples": ["Chanel", "Victoria's Secret", "Godiva"],
+            ),
+            "examples": ("Chanel", "Victoria's Secret", "Godiva"),
         },
         "jester": {
             "description": "Seeks enjoyment and playfulness",
-            "keywords": ["fun", "play", "humor", "enjoy", "laugh", "light"],
-            "examples": ["Old Spice", "M&Ms", "Skittles"],
+            "keywords": ("fun", "play", "humor", "enjoy", "laugh", "light"),
+            "examples": ("Old Spice", "M&Ms", "Skittles"),
         },
         "caregiver": {
             "description": "Seeks to protect and care for others",
-            "keywords": ["care", "protect", "help", "support", "nurture", "safe"],
-            "examples": ["Johnson & Johnson", "Volvo", "UNICEF"],
+            "keywords": ("care", "protect", "help", "support", "nurture", "safe"),
+            "examples": ("Johnson & Johnson", "Volvo", "UNICEF"),
         },
         "ruler": {
             "description": "Seeks control and leadership",
-            "keywords": ["lead", "control", "power", "success", "status", "premium"],
-            "examples": ["Rolex", "Mercedes-Benz", "American Express"],
+            "keywords": ("lead", "control", "power", "success", "status", "premium"),
+            "examples": ("Rolex", "Mercedes-Benz", "American Express"),
         },
         "creator": {
             "description": "Seeks to create something of enduring value",
-            "keywords": ["create", "build", "innovate", "design", "craft", "art"],
-            "examples": ["Lego", "Adobe", "Pinterest"],
+            "keywords": ("create", "build", "innovate", "design", "craft", "art"),
+            "examples": ("Lego", "Adobe", "Pinterest"),
         },
         "innocent": {
             "description": "Seeks happiness and simplicity",
-            "keywords": ["simple", "pure", "honest", "good", "happy", "natural"],
-            "examples": ["Coca-Cola", "Dove", "Nintendo"],
+            "keywords": ("simple", "pure", "honest", "good", "happy", "natural"),
+            "examples": ("Coca-Cola", "Dove", "Nintendo"),
         },
         "sage": {
             "description": "Seeks truth and understanding",
-            "keywords": ["know", "learn", "truth", "wisdom", "expert", "research"],
-            "examples": ["Google", "BBC", "Harvard"],
+            "keywords": ("know", "learn", "truth", "wisdom", "expert", "research"),
+            "examples": ("Google", "BBC", "Harvard"),
         },
         "explorer": {
             "description": "Seeks freedom through exploration",
-            "keywords": [
+            "keywords": (
                 "discover",
                 "explore",
                 "adventure",
                 "freedom",
                 "journey",
                 "new",
-            ],
-            "examples": ["Jeep", "Patagonia", "National Geographic"],
+            ),
+            "examples": ("Jeep", "Patagonia", "National Geographic"),
         },
     }
+)
+
+# Display names as reported ("hero" -> "Hero"), matching BrandArchetype values
+_ARCHETYPE_TITLES = {name: name.title() for name in ARCHETYPES}
+
+
+# =============================================================================
+# Word Lists
+# =============================================================================
+
+# Common jargon/buzzwords. These often indicate "corporate speak" and lower
+# conversion. Kept in display order and casing for the report examples.
+JARGON_TERMS = (
+    "synergy",
+    "paradigm",
+    "leverage",
+    "holistic",
+    "ecosystem",
+    "disrupt",
+    "blockchain",
+    "Web3",
+    "tokenomics",
+    "DeFi",
+    "scalable",
+    "innovative",
+    "revolutionary",
+    "next-generation",
+    "cutting-edge",
+    "best-in-class",
+    "world-class",
+)
+
+# Verbs that make a headline explain what the visitor can do
+ACTION_WORDS = frozenset(
+    ["get", "create", "build", "discover", "start", "learn", "buy", "try"]
+)
+
+# Filler adjectives that make a headline vague
+VAGUE_WORDS = frozenset(["innovative", "amazing", "best", "unique", "revolutionary"])
+
+# Readability reported when there is too little text to score
+DEFAULT_READABILITY = MappingProxyType(
+    {
+        "flesch_reading_ease": 50,
+        "grade_level": 10,
+        "is_jargon_heavy": False,
+        "jargon_examples": [],
+    }
+)
+
+
+# =============================================================================
+# Text Helpers
+# =============================================================================
+
+
+def _title_tagline(title: str) -> Optional[str]:
+    """Return the part of a page title before " - ", or None if there is none."""
+    head, separator, _ = title.partition(" - ")
+    return head if separator else None
+
+
+@lru_cache(maxsize=128)
+def _flesch_scores(content: str) -> Tuple[float, float]:
+    """
+    Flesch Reading Ease and Flesch-Kincaid grade for a document.
+
+    Both scores derive from the same word, sentence and syllable counts
+    (which textstat memoizes between the two calls). The pair is memoized
+    per document too, so re-analyzing an unchanged page skips textstat.
+    """
+    return textstat.flesch_reading_ease(content), textstat.flesch_kincaid_grade(content)
+
+
+def _index_keywords(archetypes: Mapping[str, Any]) -> Dict[str, Tuple[str, ...]]:
+    """Map each archetype keyword to the archetypes that list it."""
+    index: Dict[str, List[str]] = {}
+    for archetype, data in archetypes.items():
+        for keyword in data["keywords"]:
+            index.setdefault(keyword, []).append(archetype)
+    return {keyword: tuple(names) for keyword, names in index.items()}
+
+
+# Keyword -> archetypes listing it, and a single-scan matcher over all
+# archetype keywords for the heuristic fallback
+_KEYWORD_ARCHETYPES = _index_keywords(ARCHETYPES)
+_match_archetype_keywords = keyword_matcher(_KEYWORD_ARCHETYPES)
+
+
+class BrandMessagingAnalyzer(BaseAnalyzer):
+    """
+    Analyzes Brand Messaging & Archetype.
+    """
+
+    __slots__ = ()
+
+    MODULE_NAME = "brand_messaging"
+    WEIGHT = 0.15
+
+    # Below this many words the page is scored from keywords only, with the
+    # archetype confidence capped
+    MIN_ANALYSIS_WORDS = 50
+    THIN_CONTENT_CONFIDENCE = 0.5
+
+    # The 12 Brand Archetypes, shared read-only with the module
+    ARCHETYPES = ARCHETYPES
 
     async def analyze(self) -> AnalyzerResult:
         """
@@ -143,40 +258,69 @@ class BrandMessagingAnalyzer(BaseAnalyzer):
             # ----------------------------------------------------------------
             homepage_content = self.scraped_data.get("text_content", "")
             about_content = self.scraped_data.get("about_content", "")
-            # Combine content but truncate to avoid hitting token limits
-            combined_content = f"{homepage_content}\n\n{about_content}"[:8000]
+            # Combine content but truncate to avoid hitting token limits.
+            # Each part is cut first so a huge page is never copied whole.
+            homepage_head = homepage_content[:8000]
+            combined_content = f"{homepage_head}\n\n{about_content[:8000]}"[:8000]
+            # Lowercased once for every keyword/word-list check below
+            content_lower = combined_content.lower()
 
             # ----------------------------------------------------------------
-            # 2. Analyze with GPT-4 (or fallback to heuristics)
+            # 2. Readability + archetype/tone analysis
             # ----------------------------------------------------------------
-            if settings.OPENAI_API_KEY and len(combined_content) > 100:
-                gpt_analysis = await self._analyze_with_gpt(combined_content)
+            # Pages with almost no text (parked domains, client-rendered apps)
+            # give GPT and textstat nothing to work with. Score them from
+            # keywords alone instead of paying for an OpenAI round trip.
+            thin_content = len(content_lower.split()) < self.MIN_ANALYSIS_WORDS
+            self._raw_data["thin_content"] = thin_content
+
+            if thin_content:
+                gpt_analysis = self._analyze_with_heuristics(content_lower)
+                archetype = gpt_analysis["archetype"]
+                archetype["confidence"] = min(
+                    archetype["confidence"], self.THIN_CONTENT_CONFIDENCE
+                )
+                readability = dict(DEFAULT_READABILITY)
             else:
-                gpt_analysis = self._analyze_with_heuristics(combined_content)
+                # Readability: grade level, jargon density. textstat's
+                # syllable counting is pure Python (and loads its dictionaries
+                # on first use), so run it off the event loop shared with
+                # other analyzers. It only needs the text, so start it now
+                # and let it overlap the GPT round trip.
+                readability_task = asyncio.ensure_future(
+                    asyncio.to_thread(
+                        self._analyze_readability, combined_content, content_lower
+                    )
+                )
 
-            self._raw_data["gpt_analysis"] = gpt_analysis
+                # Archetype and tone with GPT-4 (or fallback to heuristics)
+                try:
+                    if settings.OPENAI_API_KEY:
+                        gpt_analysis = await self._analyze_with_gpt(combined_content)
+                    else:
+                        gpt_analysis = self._analyze_with_heuristics(content_lower)
+                finally:
+                    readability = await readability_task
 
-            # ----------------------------------------------------------------
-            # 3. Readability Analysis
-            # ----------------------------------------------------------------
-            # Basic stats: grade level, jargon density
-            readability = self._analyze_readability(combined_content)
+            self._raw_data["gpt_analysis"] = gpt_analysis
             self._raw_data["readability"] = readability
 
             # ----------------------------------------------------------------
-            # 4. Value Proposition Analysis
+            # 3. Value Proposition Analysis
             # ----------------------------------------------------------------
             # Does the H1 make sense?
-            value_prop = self._analyze_value_proposition()
+            # Page title without its " - Site Name" suffix, if it has one
+            tagline = _title_tagline(self.scraped_data.get("title", ""))
+            value_prop = self._analyze_value_proposition(tagline)
             self._raw_data["value_proposition"] = value_prop
 
             # ----------------------------------------------------------------
-            # 5. Calculate score
+            # 4. Calculate score
             # ----------------------------------------------------------------
             score = self._calculate_score()
 
             # ----------------------------------------------------------------
-            # 6. Generate findings and recommendations
+            # 5. Generate findings and recommendations
             # ----------------------------------------------------------------
             self._findings = self._generate_findings()
             self._recommendations = self._generate_recommendations()
@@ -190,9 +334,7 @@ class BrandMessagingAnalyzer(BaseAnalyzer):
                 "archetype": archetype_data,
                 "value_proposition": value_prop.get("proposition"),
                 "value_proposition_clarity": value_prop.get("clarity", 5),
-                "tagline": self.scraped_data.get("title", "").split(" - ")[0]
-                if " - " in self.scraped_data.get("title", "")
-                else None,
+                "tagline": tagline,
                 "tone_keywords": gpt_analysis.get("tone_keywords", []),
                 "tone_description": gpt_analysis.get("tone_description"),
                 "tone_consistency": gpt_analysis.get("tone_consistency", 7),
@@ -212,10 +354,7 @@ class BrandMessagingAnalyzer(BaseAnalyzer):
             )
 
         except Exception as e:
-            return AnalyzerResult(
-                score=0,
-                error=f"Brand messaging analysis failed: {str(e)}",
-            )
+            return AnalyzerResult.failure(f"Brand messaging analysis failed: {str(e)}")
 
     async def _analyze_with_gpt(self, content: str) -> Dict[str, Any]:
         """
@@ -229,11 +368,12 @@ class BrandMessagingAnalyzer(BaseAnalyzer):
             brand_name = self.scraped_data.get("brand_name") or self.domain
 
             # Run archetype and tone analysis in parallel
-            # This makes the API calls concurrent, saving time
-            archetype_result = await openai_service.analyze_archetype(
-                content, brand_name
+            # This makes the API calls concurrent, saving time. Each call
+            # already falls back to a default result on API errors.
+            archetype_result, tone_result = await asyncio.gather(
+                openai_service.analyze_archetype(content, brand_name),
+                openai_service.analyze_tone(content),
             )
-            tone_result = await openai_service.analyze_tone(content)
 
             # Build result from service responses
             return {
@@ -260,33 +400,32 @@ class BrandMessagingAnalyzer(BaseAnalyzer):
 
         except Exception as e:
             print(f"GPT analysis failed: {e}")
-            return self._analyze_with_heuristics(content)
+            return self._analyze_with_heuristics(content.lower())
 
-    def _analyze_with_heuristics(self, content: str) -> Dict[str, Any]:
+    def _analyze_with_heuristics(self, content_lower: str) -> Dict[str, Any]:
         """
         Fallback analysis using keyword matching.
         Used when OpenAI API is unavailable or configured off.
+
+        Args:
+            content_lower: Combined page content, already lowercased
         """
-        content_lower = content.lower()
 
-        # Score each archetype based on keyword presence
-        archetype_scores = {}
-        for archetype, data in self.ARCHETYPES.items():
-            score = sum(1 for kw in data["keywords"] if kw in content_lower)
-            archetype_scores[archetype] = score
+        # Score each archetype by how many of its keywords appear
+        archetype_scores = Counter(dict.fromkeys(self.ARCHETYPES, 0))
+        for keyword in _match_archetype_keywords(content_lower):
+            for archetype in _KEYWORD_ARCHETYPES[keyword]:
+                archetype_scores[archetype] += 1
 
-        # Get top archetype
+        # Get top archetype (ties go to the first in ARCHETYPES order)
         if archetype_scores:
-            primary = max(archetype_scores, key=archetype_scores.get)
-            primary_score = archetype_scores[primary]
+            top_archetypes = archetype_scores.most_common(2)
+            primary, primary_score = top_archetypes[0]
 
             # Get secondary if close
-            sorted_archetypes = sorted(
-                archetype_scores.items(), key=lambda x: x[1], reverse=True
-            )
             secondary = (
-                sorted_archetypes[1][0]
-                if len(sorted_archetypes) > 1 and sorted_archetypes[1][1] > 0
+                top_archetypes[1][0]
+                if len(top_archetypes) > 1 and top_archetypes[1][1] > 0
                 else None
             )
 
@@ -299,11 +438,11 @@ class BrandMessagingAnalyzer(BaseAnalyzer):
 
         return {
             "archetype": {
-                "primary": primary.title(),
-                "secondary": secondary.title() if secondary else None,
+                "primary": _ARCHETYPE_TITLES[primary],
+                "secondary": _ARCHETYPE_TITLES[secondary] if secondary else None,
                 "confidence": min(0.9, primary_score / 10 + 0.3),
                 "description": archetype_info["description"],
-                "example_brands": archetype_info["examples"],
+                "example_brands": list(archetype_info["examples"]),
             },
             "tone_keywords": ["professional", "informative"],
             "tone_description": "The brand uses a professional tone focused on conveying information.",
@@ -312,49 +451,23 @@ class BrandMessagingAnalyzer(BaseAnalyzer):
             "tone_consistency": 6,
         }
 
-    def _analyze_readability(self, content: str) -> Dict[str, Any]:
+    def _analyze_readability(self, content: str, content_lower: str) -> Dict[str, Any]:
         """
         Analyze text readability using textstat.
+
+        Args:
+            content: Combined page content
+            content_lower: The same content lowercased, for the jargon check
         """
         if len(content) < 100:
-            return {
-                "flesch_reading_ease": 50,
-                "grade_level": 10,
-                "is_jargon_heavy": False,
-                "jargon_examples": [],
-            }
+            return dict(DEFAULT_READABILITY)
 
-        # Flesch Reading Ease (higher is easier)
-        flesch_score = textstat.flesch_reading_ease(content)
-
-        # Grade level
-        grade_level = textstat.flesch_kincaid_grade(content)
-
-        # Check for common jargon/buzzwords
-        # These words often indicate "corporate speak" and lower conversion
-        jargon_terms = [
-            "synergy",
-            "paradigm",
-            "leverage",
-            "holistic",
-            "ecosystem",
-            "disrupt",
-            "blockchain",
-            "Web3",
-            "tokenomics",
-            "DeFi",
-            "scalable",
-            "innovative",
-            "revolutionary",
-            "next-generation",
-            "cutting-edge",
-            "best-in-class",
-            "world-class",
-        ]
-
-        found_jargon = [
-            term for term in jargon_terms if term.lower() in content.lower()
-        ]
+        # Flesch Reading Ease (higher is easier) and grade level
+        flesch_score, grade_level = _flesch_scores(content)
+
+        # Check for common jargon/buzzwords as whole words
+        tokens = word_tokens(content_lower)
+        found_jargon = [term for term in JARGON_TERMS if term.lower() in tokens]
         is_jargon_heavy = len(found_jargon) >= 3
 
         return {
@@ -364,10 +477,13 @@ class BrandMessagingAnalyzer(BaseAnalyzer):
             "jargon_examples": found_jargon[:5],
         }
 
-    def _analyze_value_proposition(self) -> Dict[str, Any]:
+    def _analyze_value_proposition(self, tagline: Optional[str]) -> Dict[str, Any]:
         """
         Analyze the clarity of the value proposition.
         Checks if the main headline contains action verbs and isn't too vague.
+
+        Args:
+            tagline: Page title without its suffix, or None if it has none
         """
         # Get homepage heading
         headings = self.scraped_data.get("headings", {})
@@ -376,34 +492,22 @@ class BrandMessagingAnalyzer(BaseAnalyzer):
         self.scraped_data.get("meta_description", "")
 
         # Try to identify value proposition
-        proposition = (
-            h1s[0] if h1s else title.split(" - ")[0] if " - " in title else title
-        )
+        proposition = h1s[0] if h1s else tagline if tagline is not None else title
 
         # Evaluate clarity (heuristic)
         clarity = 5  # Default
 
         if proposition:
             # Check if it explains what the product is
-            action_words = [
-                "get",
-                "create",
-                "build",
-                "discover",
-                "start",
-                "learn",
-                "buy",
-                "try",
-            ]
-            has_action = any(word in proposition.lower() for word in action_words)
+            proposition_tokens = word_tokens(proposition.lower())
+            has_action = not ACTION_WORDS.isdisjoint(proposition_tokens)
 
             # Check length (too short or too long is bad)
             word_count = len(proposition.split())
             good_length = 5 <= word_count <= 15
 
             # Check for vagueness
-            vague_words = ["innovative", "amazing", "best", "unique", "revolutionary"]
-            is_vague = any(word in proposition.lower() for word in vague_words)
+            is_vague = not VAGUE_WORDS.isdisjoint(proposition_tokens)
 
             if has_action and good_length and not is_vague:
                 clarity = 8
@@ -480,6 +584,17 @@ class BrandMessagingAnalyzer(BaseAnalyzer):
                 )
             )
 
+        if self._raw_data.get("thin_content"):
+            findings.append(
+                Finding(
+                    title="Insufficient Content for Deep Analysis",
+                    detail="The homepage has very little readable text, so the archetype "
+                    "was estimated from keywords and readability was not scored. "
+                    "Pages rendered only in the browser may look empty to crawlers too.",
+                    severity=SeverityLevel.MEDIUM,
+                )
+            )
+
         # Readability findings
         grade = readability.get("grade_level", 10)
         if grade > 12:
@@ -20,15 +20,81 @@
 # - Alignment Score: How well does your actual presence match the ideal profile?
 # =============================================================================
 
+from operator import attrgetter
 from typing import List
 
+from pydantic import TypeAdapter
+
 from app.analyzers.base import BaseAnalyzer, AnalyzerResult
 from app.models.report import Finding, Recommendation, SeverityLevel, ChannelScore
+from app.utils.nlp import keyword_matcher
+
+# Keywords that suggest a business or a consumer audience
+B2B_KEYWORDS = frozenset(
+    ["enterprise", "business", "teams", "company", "api", "integration"]
+)
+B2C_KEYWORDS = frozenset(
+    ["users", "people", "everyone", "personal", "free", "download"]
+)
+
+_match_product_keywords = keyword_matcher(B2B_KEYWORDS | B2C_KEYWORDS)
+
+# Dumps a whole list of channel scores in one call
+_CHANNEL_SCORES = TypeAdapter(List[ChannelScore])
+
+# (score, rationale) per channel for each brand profile. "crypto" applies
+# when the industry is crypto and takes precedence over "B2B"/"B2C".
+CHANNEL_PROFILES = {
+    # Twitter - essential for tech/crypto
+    "twitter": {
+        "crypto": (
+            9,
+            "Essential for real-time engagement and industry conversations.",
+        ),
+        "B2B": (7, "Good for thought leadership and announcements."),
+        "B2C": (6, "Good for thought leadership and announcements."),
+    },
+    # LinkedIn - great for B2B
+    "linkedin": {
+        "B2B": (8, "Excellent for B2B credibility and investor visibility."),
+        "B2C": (5, "Excellent for B2B credibility and investor visibility."),
+    },
+    # TikTok - consumer/visual products
+    "tiktok": {
+        "B2B": (3, "Low priority for B2B/technical products."),
+        "B2C": (7, "Best for visual, consumer-focused content."),
+    },
+    # YouTube - tutorials and demos
+    # Generally high potential for everyone (Video is king)
+    "youtube": {
+        "B2B": (
+            7,
+            "Great for tutorials, demos, and educational content. High SEO value.",
+        ),
+        "B2C": (
+            7,
+            "Great for tutorials, demos, and educational content. High SEO value.",
+        ),
+    },
+    # Discord - community
+    "discord": {
+        "crypto": (9, "Essential for community building in crypto/gaming."),
+        "B2B": (6, "Good for engaged user communities."),
+        "B2C": (6, "Good for engaged user communities."),
+    },
+}
+
+
+def _suitability(score: int) -> str:
+    """Label a 0-10 channel score as high, medium or low suitability."""
+    return "high" if score >= 7 else "medium" if score >= 5 else "low"
 
 
 class ChannelFitAnalyzer(BaseAnalyzer):
     """Analyzes channel suitability for the brand based on product and audience."""
 
+    __slots__ = ()
+
     MODULE_NAME = "channel_fit"
     WEIGHT = 0.05
 
@@ -38,23 +104,37 @@ class ChannelFitAnalyzer(BaseAnalyzer):
         try:
             self._raw_data = {}
 
+            # Classify once; channel scoring and the report both use it
+            product_type = self._infer_product_type()
+            self._raw_data["product_type"] = product_type
+
             # Score each channel
-            channel_scores = self._score_channels()
+            channel_scores = self._score_channels(product_type)
             self._raw_data["channels"] = channel_scores
 
+            # Bucket the channels in one pass; underutilized channels are
+            # kept for the findings and recommendations
+            top, underutilized, low = [], [], []
+            for c in channel_scores:
+                if c.score >= 7:
+                    top.append(c.channel)
+                    if not c.current_presence:
+                        underutilized.append(c.channel)
+                elif c.score <= 4:
+                    low.append(c.channel)
+            self._raw_data["underutilized"] = underutilized
+
             score = self._calculate_score()
             self._findings = self._generate_findings()
             self._recommendations = self._generate_recommendations()
 
             result_data = {
                 "score": score,
-                "channels": [c.model_dump() for c in channel_scores],
-                "top_channels": [c.channel for c in channel_scores if c.score >= 7][:3],
-                "underutilized_channels": self._get_underutilized(),
-                "low_priority_channels": [
-                    c.channel for c in channel_scores if c.score <= 4
-                ],
-                "product_type": self._infer_product_type(),
+                "channels": _CHANNEL_SCORES.dump_python(channel_scores),
+                "top_channels": top[:3],
+                "underutilized_channels": underutilized,
+                "low_priority_channels": low,
+                "product_type": product_type,
                 "industry": self.industry,
             }
 
@@ -65,108 +145,49 @@ class ChannelFitAnalyzer(BaseAnalyzer):
                 data=result_data,
             )
         except Exception as e:
-            return AnalyzerResult(score=0, error=str(e))
+            return AnalyzerResult.failure(str(e))
 
     def _infer_product_type(self) -> str:
         """Infer B2B vs B2C from content."""
-        text = self.scraped_data.get("text_content", "").lower()
-        b2b_keywords = [
-            "enterprise",
-            "business",
-            "teams",
-            "company",
-            "api",
-            "integration",
-        ]
-        b2c_keywords = ["users", "people", "everyone", "personal", "free", "download"]
-
-        b2b_score = sum(1 for kw in b2b_keywords if kw in text)
-        b2c_score = sum(1 for kw in b2c_keywords if kw in text)
+        text = self.get_lowercase_content("text_content")
+        found = _match_product_keywords(text)
+
+        b2b_score = len(found & B2B_KEYWORDS)
+        b2c_score = len(found & B2C_KEYWORDS)
 
         return "B2B" if b2b_score > b2c_score else "B2C"
 
-    def _score_channels(self) -> List[ChannelScore]:
-        """Score each channel for suitability."""
+    def _score_channels(self, product_type: str) -> List[ChannelScore]:
+        """Score each channel for suitability given the B2B/B2C product type."""
         social_links = self.scraped_data.get("social_links", {})
-        product_type = self._infer_product_type()
         is_crypto = self.industry and "crypto" in self.industry.lower()
 
         scores = []
-
-        # Twitter - essential for tech/crypto
-        twitter_score = 9 if is_crypto else 7 if product_type == "B2B" else 6
-        scores.append(
-            ChannelScore(
-                channel="twitter",
-                score=twitter_score,
-                suitability="high" if twitter_score >= 7 else "medium",
-                rationale="Essential for real-time engagement and industry conversations."
-                if is_crypto
-                else "Good for thought leadership and announcements.",
-                current_presence="twitter" in social_links,
-            )
-        )
-
-        # LinkedIn - great for B2B
-        linkedin_score = 8 if product_type == "B2B" else 5
-        scores.append(
-            ChannelScore(
-                channel="linkedin",
-                score=linkedin_score,
-                suitability="high" if linkedin_score >= 7 else "medium",
-                rationale="Excellent for B2B credibility and investor visibility.",
-                current_presence="linkedin" in social_links,
-            )
-        )
-
-        # TikTok - consumer/visual products
-        tiktok_score = 3 if product_type == "B2B" else 7
-        scores.append(
-            ChannelScore(
-                channel="tiktok",
-                score=tiktok_score,
-                suitability="low" if tiktok_score <= 4 else "medium",
-                rationale="Best for visual, consumer-focused content."
-                if tiktok_score > 4
-                else "Low priority for B2B/technical products.",
-                current_presence="tiktok" in social_links,
-            )
-        )
-
-        # YouTube - tutorials and demos
-        # Generally high potential for everyone (Video is king)
-        youtube_score = 7
-        scores.append(
-            ChannelScore(
-                channel="youtube",
-                score=youtube_score,
-                suitability="high",
-                rationale="Great for tutorials, demos, and educational content. High SEO value.",
-                current_presence="youtube" in social_links,
-            )
-        )
-
-        # Discord - community
-        discord_score = 9 if is_crypto else 6
-        scores.append(
-            ChannelScore(
-                channel="discord",
-                score=discord_score,
-                suitability="high" if discord_score >= 7 else "medium",
-                rationale="Essential for community building in crypto/gaming."
-                if is_crypto
-                else "Good for engaged user communities.",
-                current_presence="discord" in social_links,
+        for channel, profiles in CHANNEL_PROFILES.items():
+            # A crypto profile, where a channel has one, overrides B2B/B2C
+            profile = profiles.get("crypto") if is_crypto else None
+            score, rationale = profile or profiles[product_type]
+            scores.append(
+                ChannelScore(
+                    channel=channel,
+                    score=score,
+                    suitability=_suitability(score),
+                    rationale=rationale,
+                    current_presence=channel in social_links,
+                )
             )
-        )
 
-        return sorted(scores, key=lambda x: x.score, reverse=True)
+        return sorted(scores, key=attrgetter("score"), reverse=True)
 
     def _get_underutilized(self) -> List[str]:
         """Find high-potential channels not being used."""
-        channels = self._raw_data.get("channels", [])
-
-        return [c.channel for c in channels if c.score >= 7 and not c.current_presence]
+        underutilized = self._raw_data.get("underutilized")
+        if underutilized is None:
+            channels = self._raw_data.get("channels", [])
+            underutilized = [
+                c.channel for c in channels if c.score >= 7 and not c.current_presence
+            ]
+        return underutilized
 
     def _calculate_score(self) -> float:
         """Score based on alignment between high-fit channels and actual presence."""
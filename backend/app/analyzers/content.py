@@ -25,13 +25,72 @@
 
 from typing import Dict, Any, List
 
+from pydantic import TypeAdapter
+
 from app.analyzers.base import BaseAnalyzer, AnalyzerResult
 from app.models.report import Finding, Recommendation, SeverityLevel, PostAnalysis
+from app.utils.nlp import word_tokens
+
+# Website topics and the words that signal them, in reporting order. Topics
+# are matched on whole words, so inflected forms and compounds ("payments",
+# "investors", "fintech") are listed explicitly.
+TOPIC_KEYWORDS = {
+    "technology": frozenset(
+        [
+            "tech",
+            "technology",
+            "technologies",
+            "technical",
+            "fintech",
+            "software",
+            "platform",
+            "platforms",
+            "api",
+            "apis",
+        ]
+    ),
+    "finance": frozenset(
+        [
+            "payment",
+            "payments",
+            "financial",
+            "financially",
+            "money",
+            "invest",
+            "invests",
+            "invested",
+            "investing",
+            "investment",
+            "investments",
+            "investor",
+            "investors",
+        ]
+    ),
+    "crypto": frozenset(
+        [
+            "blockchain",
+            "blockchains",
+            "crypto",
+            "cryptocurrency",
+            "cryptocurrencies",
+            "defi",
+            "web3",
+        ]
+    ),
+    "community": frozenset(
+        ["community", "communities", "users", "members", "together"]
+    ),
+}
+
+# Dumps a whole list of posts in one call
+_POSTS = TypeAdapter(List[PostAnalysis])
 
 
 class ContentAnalyzer(BaseAnalyzer):
     """Analyzes content strategy based on recent posts and blog content."""
 
+    __slots__ = ()
+
     MODULE_NAME = "content"
     WEIGHT = 0.10
 
@@ -54,7 +113,7 @@ class ContentAnalyzer(BaseAnalyzer):
 
             result_data = {
                 "score": score,
-                "recent_posts": [p.model_dump() for p in posts.get("items", [])],
+                "recent_posts": _POSTS.dump_python(posts.get("items", [])),
                 "content_mix": posts.get("content_mix", {}),
                 "overall_sentiment": "positive",
                 "uses_images": True,
@@ -69,24 +128,19 @@ class ContentAnalyzer(BaseAnalyzer):
                 data=result_data,
             )
         except Exception as e:
-            return AnalyzerResult(score=0, error=str(e))
+            return AnalyzerResult.failure(str(e))
 
     def _analyze_web_content(self) -> Dict[str, Any]:
         """Analyze website content themes."""
-        text = self.scraped_data.get("text_content", "").lower()
-
-        # Simple topic detection
-        topics = []
-        topic_keywords = {
-            "technology": ["tech", "software", "platform", "api"],
-            "finance": ["payment", "financial", "money", "invest"],
-            "crypto": ["blockchain", "crypto", "defi", "web3"],
-            "community": ["community", "users", "members", "together"],
-        }
-
-        for topic, keywords in topic_keywords.items():
-            if any(kw in text for kw in keywords):
-                topics.append(topic)
+        text = self.get_lowercase_content("text_content")
+
+        # Simple topic detection on whole words
+        tokens = word_tokens(text)
+        topics = [
+            topic
+            for topic, keywords in TOPIC_KEYWORDS.items()
+            if not keywords.isdisjoint(tokens)
+        ]
 
         return {"topics": topics[:3], "word_count": len(text.split())}
 
@@ -6,7 +6,12 @@
 # =============================================================================
 
 import asyncio
-from typing import Dict, Any, Optional, Callable, Awaitable, List
+from bisect import bisect_right
+import hashlib
+import heapq
+import json
+import math
+from typing import Dict, Any, Optional, Callable, Awaitable, List, Tuple, Type
 from datetime import datetime
 
 from app.config import settings
@@ -21,10 +26,116 @@ from app.models.report import (
     TeamPresenceReport,
     ChannelFitReport,
     ScoreCard,
+    Finding,
     Recommendation,
 )
-from app.analyzers.base import AnalysisContext, AnalyzerResult
+from app.analyzers.base import (
+    AnalysisContext,
+    AnalyzerResult,
+    BaseAnalyzer,
+    extract_domain,
+)
+from app.analyzers.seo import SEOAnalyzer
+from app.analyzers.social import SocialMediaAnalyzer
+from app.analyzers.brand import BrandMessagingAnalyzer
+from app.analyzers.ux import UXAnalyzer
+from app.analyzers.ai_discoverability import AIDiscoverabilityAnalyzer
+from app.analyzers.content import ContentAnalyzer
+from app.analyzers.team import TeamPresenceAnalyzer
+from app.analyzers.channel_fit import ChannelFitAnalyzer
 from app.scrapers.website import WebsiteScraper
+from app.utils.cache import cache
+
+# Report section name and analyzer class for every module, in run order
+_ANALYZER_CLASSES: Tuple[Tuple[str, Type[BaseAnalyzer]], ...] = (
+    ("seo", SEOAnalyzer),
+    ("social_media", SocialMediaAnalyzer),
+    ("brand_messaging", BrandMessagingAnalyzer),
+    ("website_ux", UXAnalyzer),
+    ("ai_discoverability", AIDiscoverabilityAnalyzer),
+    ("content", ContentAnalyzer),
+    ("team_presence", TeamPresenceAnalyzer),
+    ("channel_fit", ChannelFitAnalyzer),
+)
+
+# Weight of each module in the overall score. Settings are loaded once at
+# startup, so the mapping is built with the module rather than per report.
+_MODULE_WEIGHTS = {
+    "seo": settings.WEIGHT_SEO,
+    "social_media": settings.WEIGHT_SOCIAL_MEDIA,
+    "brand_messaging": settings.WEIGHT_BRAND_MESSAGING,
+    "website_ux": settings.WEIGHT_WEBSITE_UX,
+    "ai_discoverability": settings.WEIGHT_AI_DISCOVERABILITY,
+    "content": settings.WEIGHT_CONTENT,
+    "team_presence": settings.WEIGHT_TEAM_PRESENCE,
+    "channel_fit": settings.WEIGHT_CHANNEL_FIT,
+}
+
+# Letter grade bands for _calculate_grade: ascending thresholds and grades
+_GRADE_THRESHOLDS = (50, 60, 70, 80, 90)
+_GRADE_LETTERS = ("F", "D", "C", "B", "A", "A+")
+
+# Summary opening sentence for scores below 60, from 60, and from 80
+_SUMMARY_THRESHOLDS = (60, 80)
+_SUMMARY_OPENINGS = (
+    "This brand has significant opportunities for improvement, with a current score of {score:.0f}/100 (Grade {grade}).",
+    "This brand shows solid fundamentals with a score of {score:.0f}/100 (Grade {grade}), though there's room for improvement.",
+    "This brand demonstrates strong overall performance with a score of {score:.0f}/100 (Grade {grade}).",
+)
+
+# Recommendation sort order by priority (critical > high > medium > low)
+_PRIORITY_ORDER = {"critical": 0, "high": 1, "medium": 2, "low": 3, "info": 4}
+
+
+def _priority_key(recommendation: Recommendation) -> int:
+    """Sort key ranking a recommendation by priority, unknowns last."""
+    return _PRIORITY_ORDER.get(recommendation.priority.value, 4)
+
+
+def _result_to_cache(result: AnalyzerResult) -> Optional[Dict[str, Any]]:
+    """
+    Serialize a successful analyzer result for the result cache.
+
+    Returns None when the module data holds values that wouldn't survive a
+    JSON round trip (dataclasses, datetimes), so those results aren't cached.
+    """
+    try:
+        json.dumps(result.data)
+    except (TypeError, ValueError):
+        return None
+
+    return {
+        "score": result.score,
+        "findings": [f.model_dump(mode="json") for f in result.findings],
+        "recommendations": [r.model_dump(mode="json") for r in result.recommendations],
+        "data": result.data,
+    }
+
+
+def _has_failed_lookup(raw_data: Dict[str, Any]) -> bool:
+    """
+    Check whether an analyzer's external lookups include a failed one.
+
+    Lookups record {"available": False, "error": ...} in the analyzer's raw
+    data when an API errored or was rate limited. Such a result scores the
+    module as if the signal were missing, so it isn't worth reusing.
+    """
+    return any(
+        isinstance(value, dict)
+        and value.get("available") is False
+        and bool(value.get("error"))
+        for value in raw_data.values()
+    )
+
+
+def _result_from_cache(cached: Dict[str, Any]) -> AnalyzerResult:
+    """Rebuild an analyzer result stored by _result_to_cache."""
+    return AnalyzerResult(
+        score=cached["score"],
+        findings=[Finding(**f) for f in cached["findings"]],
+        recommendations=[Recommendation(**r) for r in cached["recommendations"]],
+        data=cached["data"],
+    )
 
 
 class AnalysisOrchestrator:
@@ -66,15 +177,15 @@ class AnalysisOrchestrator:
         self.description = description
         self.industry = industry
 
-        # Extract domain
-        from urllib.parse import urlparse
-
-        parsed = urlparse(url)
-        self.domain = (parsed.netloc or parsed.path).replace("www.", "")
+        # Extract domain (memoized, so the analyzers reuse this parse)
+        self.domain = extract_domain(url)
 
         # Initialize context (will be populated during run)
         self.context: Optional[AnalysisContext] = None
 
+        # Digest of the scraped data, part of the analyzer result cache key
+        self._scrape_digest: Optional[str] = None
+
     async def run(
         self,
         progress_callback: Optional[Callable[[str, str], Awaitable[None]]] = None,
@@ -109,70 +220,23 @@ class AnalysisOrchestrator:
         scraped_data = await scraper.scrape()
         scraped_data = self._merge_research_with_scraped(scraped_data, research_data)
         self.context.scraped_data = scraped_data
+        self._scrape_digest = hashlib.md5(
+            json.dumps(scraped_data, sort_keys=True, default=str).encode(),
+            usedforsecurity=False,
+        ).hexdigest()
 
         # ---------------------------------------------------------------------
         # Phase 2: Run Analysis Modules
         # ---------------------------------------------------------------------
-        # Import all analyzers
-        from app.analyzers.seo import SEOAnalyzer
-        from app.analyzers.social import SocialMediaAnalyzer
-        from app.analyzers.brand import BrandMessagingAnalyzer
-        from app.analyzers.ux import UXAnalyzer
-        from app.analyzers.ai_discoverability import AIDiscoverabilityAnalyzer
-        from app.analyzers.content import ContentAnalyzer
-        from app.analyzers.team import TeamPresenceAnalyzer
-        from app.analyzers.channel_fit import ChannelFitAnalyzer
-
         # Create analyzer instances
         analyzers = {
-            "seo": SEOAnalyzer(
+            name: analyzer_class(
                 url=self.url,
                 description=self.description,
                 industry=self.industry,
                 scraped_data=scraped_data,
-            ),
-            "social_media": SocialMediaAnalyzer(
-                url=self.url,
-                description=self.description,
-                industry=self.industry,
-                scraped_data=scraped_data,
-            ),
-            "brand_messaging": BrandMessagingAnalyzer(
-                url=self.url,
-                description=self.description,
-                industry=self.industry,
-                scraped_data=scraped_data,
-            ),
-            "website_ux": UXAnalyzer(
-                url=self.url,
-                description=self.description,
-                industry=self.industry,
-                scraped_data=scraped_data,
-            ),
-            "ai_discoverability": AIDiscoverabilityAnalyzer(
-                url=self.url,
-                description=self.description,
-                industry=self.industry,
-                scraped_data=scraped_data,
-            ),
-            "content": ContentAnalyzer(
-                url=self.url,
-                description=self.description,
-                industry=self.industry,
-                scraped_data=scraped_data,
-            ),
-            "team_presence": TeamPresenceAnalyzer(
-                url=self.url,
-                description=self.description,
-                industry=self.industry,
-                scraped_data=scraped_data,
-            ),
-            "channel_fit": ChannelFitAnalyzer(
-                url=self.url,
-                description=self.description,
-                industry=self.industry,
-                scraped_data=scraped_data,
-            ),
+            )
+            for name, analyzer_class in _ANALYZER_CLASSES
         }
 
         results = await self._run_analyzers_parallel(analyzers)
@@ -199,72 +263,77 @@ class AnalysisOrchestrator:
         """
         Run all analyzers in parallel for faster execution.
 
-        Analyzers are grouped into waves to manage resource usage:
-        - Wave 1: SEO, Social, AI Discoverability (external API heavy)
-        - Wave 2: Brand, UX, Content (compute heavy)
-        - Wave 3: Team, Channel Fit (depends on other results)
+        Analyzers only read the scraped data, never each other's results, so
+        they all start together and the phase takes as long as the slowest
+        module rather than the sum of per-wave maxima. At most
+        ANALYZER_CONCURRENCY run at once.
+
+        The whole phase shares one deadline, a third of ANALYSIS_TIMEOUT, so
+        scraping, research and report building stay inside the celery soft
+        time limit. Each analyzer gets whatever is left of that deadline when
+        it starts; one that overruns it is marked failed on its own.
 
         Returns:
             Dict mapping module names to their results
         """
-        results: Dict[str, AnalyzerResult] = {}
-
-        wave_1 = ["seo", "social_media", "ai_discoverability"]
-        wave_2 = ["brand_messaging", "website_ux", "content"]
-        wave_3 = ["team_presence", "channel_fit"]
-
-        per_analyzer_timeout = settings.ANALYSIS_TIMEOUT / 3
-
-        for wave in [wave_1, wave_2, wave_3]:
-            wave_analyzers = {k: v for k, v in analyzers.items() if k in wave}
-            wave_results = await self._execute_wave(
-                wave_analyzers,
-                timeout=per_analyzer_timeout,
-            )
-            results.update(wave_results)
-
-        return results
-
-    async def _execute_wave(
-        self,
-        wave_analyzers: Dict[str, Any],
-        timeout: float,
-    ) -> Dict[str, AnalyzerResult]:
-        """Execute a wave of analyzers in parallel."""
-        results: Dict[str, AnalyzerResult] = {}
+        budget = settings.ANALYSIS_TIMEOUT / 3
+        loop = asyncio.get_running_loop()
+        deadline = loop.time() + budget
+        limit = asyncio.Semaphore(settings.ANALYZER_CONCURRENCY)
 
         async def run_single(name: str, analyzer) -> tuple[str, AnalyzerResult]:
-            await self._update_progress(name, "running")
-            try:
-                result = await asyncio.wait_for(
-                    analyzer.analyze(),
-                    timeout=timeout,
-                )
-                await self._update_progress(name, "completed")
-                return name, result
-            except asyncio.TimeoutError:
-                await self._update_progress(name, "failed")
-                return name, AnalyzerResult(
-                    score=0,
-                    error=f"Analysis timed out after {timeout:.0f}s",
-                )
-            except Exception as e:
-                await self._update_progress(name, "failed")
-                return name, AnalyzerResult(
-                    score=0,
-                    error=str(e),
-                )
-
-        tasks = [
-            run_single(name, analyzer) for name, analyzer in wave_analyzers.items()
-        ]
-
-        completed = await asyncio.gather(*tasks, return_exceptions=False)
+            async with limit:
+                await self._update_progress(name, "running")
+                try:
+                    result = await asyncio.wait_for(
+                        self._analyze_cached(name, analyzer),
+                        timeout=max(deadline - loop.time(), 0),
+                    )
+                    await self._update_progress(name, "completed")
+                    return name, result
+                except asyncio.TimeoutError:
+                    await self._update_progress(name, "failed")
+                    return name, AnalyzerResult.failure(
+                        f"Analysis timed out after {budget:.0f}s"
+                    )
+                except Exception as e:
+                    await self._update_progress(name, "failed")
+                    return name, AnalyzerResult.failure(str(e))
+
+        completed = await asyncio.gather(
+            *(run_single(name, analyzer) for name, analyzer in analyzers.items())
+        )
+        return dict(completed)
 
-        for name, result in completed:
-            results[name] = result
+    async def _analyze_cached(self, name: str, analyzer) -> AnalyzerResult:
+        """
+        Run an analyzer, reusing a recent result for the same inputs.
 
-        return results
+        Results are keyed on the module, request fields and scraped data, so
+        repeat analyses of an unchanged site within the TTL skip the analyzer
+        and its external API calls. Failed results, and results built on a
+        failed external lookup, are never cached.
+        """
+        cache_key = cache._make_key(
+            "analyzer",
+            name,
+            self.url,
+            self.description,
+            self.industry,
+            self._scrape_digest,
+        )
+        cached_result = await cache.get(cache_key)
+        if cached_result is not None:
+            return _result_from_cache(cached_result)
+
+        result = await analyzer.analyze()
+        if result.is_success() and not _has_failed_lookup(analyzer._raw_data):
+            cacheable = _result_to_cache(result)
+            if cacheable is not None:
+                await cache.set(
+                    cache_key, cacheable, ttl=cache.DEFAULT_TTLS["analyzer"]
+                )
+        return result
 
     async def _update_progress(self, module: str, status: str) -> None:
         if self.context and self.context.progress_callback:
@@ -346,29 +415,29 @@ class AnalysisOrchestrator:
         Returns:
             ScoreCard: Complete scorecard
         """
-        # Weight configuration
-        weights = {
-            "seo": settings.WEIGHT_SEO,
-            "social_media": settings.WEIGHT_SOCIAL_MEDIA,
-            "brand_messaging": settings.WEIGHT_BRAND_MESSAGING,
-            "website_ux": settings.WEIGHT_WEBSITE_UX,
-            "ai_discoverability": settings.WEIGHT_AI_DISCOVERABILITY,
-            "content": settings.WEIGHT_CONTENT,
-            "team_presence": settings.WEIGHT_TEAM_PRESENCE,
-            "channel_fit": settings.WEIGHT_CHANNEL_FIT,
-        }
-
-        # Calculate weighted score
+        # Score each module and collect strengths (score >= 75) and
+        # weaknesses (score < 60) in the same pass as the weighted sum
         total_weight = 0
         weighted_sum = 0
         scores = {}
+        strengths = []
+        weaknesses = []
 
         for module, result in results.items():
-            weight = weights.get(module, 0.1)
-            if result.is_success():
-                weighted_sum += result.score * weight
-                total_weight += weight
-            scores[module] = result.score
+            score = result.score
+            scores[module] = score
+            if not result.is_success():
+                continue
+
+            weight = _MODULE_WEIGHTS.get(module, 0.1)
+            weighted_sum += score * weight
+            total_weight += weight
+
+            label = module.replace("_", " ")
+            if score >= 75:
+                strengths.append(f"Strong {label} performance (score: {score:.0f})")
+            elif score < 60:
+                weaknesses.append(f"Needs improvement: {label} (score: {score:.0f})")
 
         overall_score = weighted_sum / total_weight if total_weight > 0 else 0
 
@@ -379,38 +448,26 @@ class AnalysisOrchestrator:
         # Calculate benchmark comparison for each module
         benchmark_comparison = self._calculate_benchmark_comparison(scores)
 
-        # Identify strengths (modules with score >= 75)
-        strengths = []
-        for module, result in results.items():
-            if result.is_success() and result.score >= 75:
-                strengths.append(
-                    f"Strong {module.replace('_', ' ')} performance (score: {result.score:.0f})"
-                )
-
-        # Identify weaknesses (modules with score < 60)
-        weaknesses = []
-        for module, result in results.items():
-            if result.is_success() and result.score < 60:
-                weaknesses.append(
-                    f"Needs improvement: {module.replace('_', ' ')} (score: {result.score:.0f})"
-                )
-
-        # Aggregate all recommendations and sort by priority
+        # Aggregate all recommendations
         all_recommendations: List[Recommendation] = []
         for result in results.values():
             all_recommendations.extend(result.recommendations)
 
-        # Sort by priority (critical > high > medium > low)
-        priority_order = {"critical": 0, "high": 1, "medium": 2, "low": 3, "info": 4}
-        all_recommendations.sort(key=lambda r: priority_order.get(r.priority.value, 4))
-
-        # Get top 5 recommendations
-        top_recommendations = all_recommendations[:5]
-
-        # Identify quick wins (high impact, low effort)
-        quick_wins = [
-            r for r in all_recommendations if r.impact == "high" and r.effort == "low"
-        ][:3]
+        # Get top 5 recommendations by priority (critical > high > medium > low).
+        # nsmallest is stable, so this matches sorting the whole list and
+        # slicing, without ordering recommendations that are never shown.
+        top_recommendations = heapq.nsmallest(5, all_recommendations, key=_priority_key)
+
+        # Identify quick wins (high impact, low effort), highest priority first
+        quick_wins = heapq.nsmallest(
+            3,
+            (
+                r
+                for r in all_recommendations
+                if r.impact == "high" and r.effort == "low"
+            ),
+            key=_priority_key,
+        )
 
         # Generate summary
         summary = self._generate_summary(overall_score, grade, strengths, weaknesses)
@@ -446,18 +503,11 @@ class AnalysisOrchestrator:
         Returns:
             str: Letter grade
         """
-        if score >= 90:
-            return "A+"
-        elif score >= 80:
-            return "A"
-        elif score >= 70:
-            return "B"
-        elif score >= 60:
-            return "C"
-        elif score >= 50:
-            return "D"
-        else:
-            return "F"
+        # NaN would bisect above every threshold; grade it F as the old
+        # comparison ladder did
+        if math.isnan(score):
+            return _GRADE_LETTERS[0]
+        return _GRADE_LETTERS[bisect_right(_GRADE_THRESHOLDS, score)]
 
     def _calculate_benchmark_comparison(
         self,
@@ -520,12 +570,9 @@ class AnalysisOrchestrator:
         weaknesses: List[str],
     ) -> str:
         """Generate a human-readable summary of the analysis."""
-        if score >= 80:
-            opening = f"This brand demonstrates strong overall performance with a score of {score:.0f}/100 (Grade {grade})."
-        elif score >= 60:
-            opening = f"This brand shows solid fundamentals with a score of {score:.0f}/100 (Grade {grade}), though there's room for improvement."
-        else:
-            opening = f"This brand has significant opportunities for improvement, with a current score of {score:.0f}/100 (Grade {grade})."
+        band = 0 if math.isnan(score) else bisect_right(_SUMMARY_THRESHOLDS, score)
+        template = _SUMMARY_OPENINGS[band]
+        opening = template.format(score=score, grade=grade)
 
         strength_text = ""
         if strengths:
@@ -562,9 +609,10 @@ class AnalysisOrchestrator:
             result = results.get(module, AnalyzerResult())
             data = result.data or {}
 
-            # Merge findings and recommendations
-            data["findings"] = [f.model_dump() for f in result.findings]
-            data["recommendations"] = [r.model_dump() for r in result.recommendations]
+            # Merge findings and recommendations. These are already validated
+            # frozen models, which pydantic accepts as-is without a dump/reload.
+            data["findings"] = list(result.findings)
+            data["recommendations"] = list(result.recommendations)
             data["score"] = result.score
 
             return report_class(**data)
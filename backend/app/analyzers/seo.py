@@ -48,6 +48,8 @@ class SEOAnalyzer(BaseAnalyzer):
     Analyzes SEO Performance for a website.
     """
 
+    __slots__ = ()
+
     MODULE_NAME = "seo"
     WEIGHT = 0.15
 
@@ -182,10 +184,7 @@ class SEOAnalyzer(BaseAnalyzer):
             )
 
         except Exception as e:
-            return AnalyzerResult(
-                score=0,
-                error=f"SEO analysis failed: {str(e)}",
-            )
+            return AnalyzerResult.failure(f"SEO analysis failed: {str(e)}")
 
     async def _get_pagespeed_insights(self) -> Optional[Dict[str, Any]]:
         """
@@ -25,6 +25,8 @@
 from typing import Dict, Any, Optional, List
 import logging
 
+from pydantic import TypeAdapter
+
 from app.analyzers.base import BaseAnalyzer, AnalyzerResult
 from app.models.report import (
     Finding,
@@ -41,12 +43,17 @@ from app.services.apify_service import (
 
 logger = logging.getLogger(__name__)
 
+# Dumps a whole list of platform metrics in one call
+_PLATFORMS = TypeAdapter(List[SocialPlatformMetrics])
+
 
 class SocialMediaAnalyzer(BaseAnalyzer):
     """
     Analyzes Social Media Presence & Engagement.
     """
 
+    __slots__ = ()
+
     MODULE_NAME = "social_media"
     WEIGHT = 0.20
 
@@ -113,7 +120,7 @@ class SocialMediaAnalyzer(BaseAnalyzer):
             # ----------------------------------------------------------------
             result_data = {
                 "score": score,
-                "platforms": [p.model_dump() for p in platforms],
+                "platforms": _PLATFORMS.dump_python(platforms),
                 "total_followers": sum(p.followers or 0 for p in platforms),
                 "platforms_active": len([p for p in platforms if self._is_active(p)]),
                 "platforms_dormant": len(
@@ -139,10 +146,7 @@ class SocialMediaAnalyzer(BaseAnalyzer):
             )
 
         except Exception as e:
-            return AnalyzerResult(
-                score=0,
-                error=f"Social media analysis failed: {str(e)}",
-            )
+            return AnalyzerResult.failure(f"Social media analysis failed: {str(e)}")
 
     async def _analyze_platform(
         self, platform: str, url: str
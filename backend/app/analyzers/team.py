@@ -30,6 +30,8 @@ from app.models.report import Finding, Recommendation, SeverityLevel
 class TeamPresenceAnalyzer(BaseAnalyzer):
     """Analyzes team and founder visibility across the web."""
 
+    __slots__ = ()
+
     MODULE_NAME = "team_presence"
     WEIGHT = 0.10
 
@@ -69,7 +71,7 @@ class TeamPresenceAnalyzer(BaseAnalyzer):
                 data=result_data,
             )
         except Exception as e:
-            return AnalyzerResult(score=0, error=str(e))
+            return AnalyzerResult.failure(str(e))
 
     def _analyze_team_page(self) -> Dict[str, Any]:
         """Check if site has a team/about page with team info."""
@@ -82,8 +84,8 @@ class TeamPresenceAnalyzer(BaseAnalyzer):
         about_content = self.scraped_data.get("about_content", "").lower()
 
         # Look for founder mentions
-        founder_keywords = ["founder", "ceo", "cto", "co-founder", "chief"]
-        founder_count = sum(1 for kw in founder_keywords if kw in about_content)
+        founder_keywords = ("founder", "ceo", "cto", "co-founder", "chief")
+        founder_count = sum(map(about_content.__contains__, founder_keywords))
 
         return {
             "exists": has_team,
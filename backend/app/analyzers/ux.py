@@ -39,6 +39,8 @@ class UXAnalyzer(BaseAnalyzer):
     Analyzes Website UX & Conversion Optimization.
     """
 
+    __slots__ = ()
+
     MODULE_NAME = "website_ux"
     WEIGHT = 0.15
 
@@ -116,10 +118,7 @@ class UXAnalyzer(BaseAnalyzer):
             )
 
         except Exception as e:
-            return AnalyzerResult(
-                score=0,
-                error=f"UX analysis failed: {str(e)}",
-            )
+            return AnalyzerResult.failure(f"UX analysis failed: {str(e)}")
 
     def _analyze_first_impression(self) -> Dict[str, Any]:
         """
@@ -129,8 +128,11 @@ class UXAnalyzer(BaseAnalyzer):
         h2s = self.scraped_data.get("headings", {}).get("h2", [])
         paragraphs = self.scraped_data.get("paragraphs", [])
 
+        # Lowercase the headline copy once for all three checks
+        texts = [text.lower() for text in h1s + h2s + paragraphs[:3]]
+
         # Check for "what" - product description
-        what_keywords = [
+        what_keywords = (
             "platform",
             "app",
             "tool",
@@ -138,28 +140,22 @@ class UXAnalyzer(BaseAnalyzer):
             "service",
             "solution",
             "helps",
-        ]
-        answers_what = any(
-            any(kw in text.lower() for kw in what_keywords)
-            for text in h1s + h2s + paragraphs[:3]
         )
+        answers_what = any(any(map(text.__contains__, what_keywords)) for text in texts)
 
         # Check for "who" - target audience
-        who_keywords = [
+        who_keywords = (
             "for",
             "teams",
             "businesses",
             "developers",
             "creators",
             "professionals",
-        ]
-        answers_who = any(
-            any(kw in text.lower() for kw in who_keywords)
-            for text in h1s + h2s + paragraphs[:3]
         )
+        answers_who = any(any(map(text.__contains__, who_keywords)) for text in texts)
 
         # Check for "why" - benefit/value
-        why_keywords = [
+        why_keywords = (
             "save",
             "faster",
             "easier",
@@ -167,11 +163,8 @@ class UXAnalyzer(BaseAnalyzer):
             "simple",
             "powerful",
             "free",
-        ]
-        answers_why = any(
-            any(kw in text.lower() for kw in why_keywords)
-            for text in h1s + h2s + paragraphs[:3]
         )
+        answers_why = any(any(map(text.__contains__, why_keywords)) for text in texts)
 
         # Calculate clarity score
         clarity_score = sum(
@@ -238,7 +231,7 @@ class UXAnalyzer(BaseAnalyzer):
 
         # Check for legal pages
         [item.get("href", "").lower() for item in nav_items]
-        html = self.scraped_data.get("html", "").lower()
+        html = self.get_lowercase_content("html")
 
         has_privacy = "privacy" in html
         has_terms = "terms" in html or "tos" in html
@@ -257,7 +250,7 @@ class UXAnalyzer(BaseAnalyzer):
     def _check_for_search(self) -> bool:
         """Check if the site has a search function."""
         forms = self.scraped_data.get("forms", [])
-        html = self.scraped_data.get("html", "").lower()
+        html = self.get_lowercase_content("html")
 
         # Check for search form
         has_search_form = any(
@@ -272,8 +265,8 @@ class UXAnalyzer(BaseAnalyzer):
 
     def _analyze_trust_signals(self) -> Dict[str, Any]:
         """Analyze trust signals on the page."""
-        html = self.scraped_data.get("html", "").lower()
-        text = self.scraped_data.get("text_content", "").lower()
+        html = self.get_lowercase_content("html")
+        text = self.get_lowercase_content("text_content")
 
         # Check for testimonials
         has_testimonials = any(
@@ -346,7 +339,7 @@ class UXAnalyzer(BaseAnalyzer):
 
     def _analyze_mobile_accessibility(self) -> Dict[str, Any]:
         """Analyze mobile responsiveness and accessibility."""
-        html = self.scraped_data.get("html", "").lower()
+        html = self.get_lowercase_content("html")
 
         # Check for viewport meta tag (basic mobile support)
         has_viewport = "viewport" in html
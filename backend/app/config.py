@@ -218,8 +218,8 @@ class Settings(BaseSettings):
     # Number of recent blog posts to analyze
     BLOG_POSTS_LIMIT: int = 5
 
-    # Max concurrent analyzers per wave (for parallel execution)
-    ANALYZER_CONCURRENCY: int = 3
+    # Max analyzers running at once (8 runs every module in parallel)
+    ANALYZER_CONCURRENCY: int = 8
 
     # -------------------------------------------------------------------------
     # x402 Payment Settings (Plasma Network)
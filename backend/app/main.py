@@ -30,6 +30,7 @@ from app.middleware.security import SecurityHeadersMiddleware
 from app.utils.logging import configure_logging, get_logger
 from app.utils.sentry import init_sentry, capture_exception
 from app.middleware.logging import RequestLoggingMiddleware
+from app.utils.http_client import close_shared_client
 
 configure_logging(
     log_level=settings.LOG_LEVEL,
@@ -69,6 +70,7 @@ async def lifespan(app: FastAPI):
     yield
 
     logger.info("Application shutting down")
+    await close_shared_client()
     await close_db()
     logger.info("Database connections closed")
 
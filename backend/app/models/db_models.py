@@ -20,8 +20,13 @@ from sqlalchemy import (
     Enum as SQLEnum,
     Index,
     TypeDecorator,
-    BigInteger,
+    text,
+    DDL,
+    event,
+    LargeBinary,
+    Numeric,
 )
+from sqlalchemy.dialects.postgresql import JSONB, UUID as PG_UUID
 from sqlalchemy.orm import relationship
 import enum
 
@@ -37,23 +42,66 @@ from app.database import Base
 class GUID(TypeDecorator):
     """
     Platform-independent GUID type.
-    Uses String(36) for SQLite, stores as UUID string.
+    Uses native UUID (16 bytes) on PostgreSQL and String(36) elsewhere.
     """
 
     impl = String(36)
     cache_ok = True
 
+    def load_dialect_impl(self, dialect):
+        if dialect.name == "postgresql":
+            return dialect.type_descriptor(PG_UUID(as_uuid=True))
+        return dialect.type_descriptor(String(36))
+
     def process_bind_param(self, value, dialect):
-        if value is not None:
-            return str(value)
+        if value is None:
+            return value
+        if dialect.name == "postgresql":
+            return value if isinstance(value, uuid.UUID) else uuid.UUID(str(value))
+        return str(value)
+
+    def process_result_value(self, value, dialect):
+        if value is None or isinstance(value, uuid.UUID):
+            return value
+        return uuid.UUID(value)
+
+
+# =============================================================================
+# 32-Byte Hex Value Type
+# =============================================================================
+# EVM nonces and hashes travel through the app as "0x"-prefixed hex strings
+# but are stored as raw bytes: 32 bytes instead of 66 characters, which keeps
+# their unique indexes dense.
+# =============================================================================
+class HexBytes32(TypeDecorator):
+    """
+    Stores a "0x"-prefixed 32-byte hex string as binary.
+    Uses BYTEA on PostgreSQL and BLOB on SQLite.
+    """
+
+    impl = LargeBinary(32)
+    cache_ok = True
+
+    def process_bind_param(self, value, dialect):
+        if isinstance(value, str):
+            return bytes.fromhex(value[2:] if value.startswith("0x") else value)
         return value
 
     def process_result_value(self, value, dialect):
         if value is not None:
-            return uuid.UUID(value)
+            return "0x" + bytes(value).hex()
         return value
 
 
+# =============================================================================
+# Cross-Database JSON Type
+# =============================================================================
+# PostgreSQL stores JSON payloads as binary JSONB (pre-parsed, indexable).
+# Other dialects (SQLite in dev/tests) fall back to the generic JSON type.
+# =============================================================================
+JSONType = JSON().with_variant(JSONB(), "postgresql")
+
+
 class AnalysisStatusEnum(str, enum.Enum):
     """
     Enum representing the status of an analysis job.
@@ -103,13 +151,13 @@ class PaymentInvoice(Base):
     )
 
     amount_atomic = Column(
-        BigInteger,
+        Numeric(78, 0),
         nullable=False,
-        comment="Payment amount in atomic units (e.g. 100000 for $0.10)",
+        comment="Payment amount in atomic units (uint256, e.g. 100000 for $0.10)",
     )
 
     nonce = Column(
-        String(66),
+        HexBytes32(),
         nullable=False,
         unique=True,
         index=True,
@@ -222,7 +270,7 @@ class Analysis(Base):
     )
 
     progress = Column(
-        JSON,
+        JSONType,
         default=dict,
         nullable=False,
         comment="Progress tracking for each analysis module",
@@ -232,14 +280,14 @@ class Analysis(Base):
     # Results
     # -------------------------------------------------------------------------
     scores = Column(
-        JSON, nullable=True, comment="Individual scores for each analysis module"
+        JSONType, nullable=True, comment="Individual scores for each analysis module"
     )
 
     overall_score = Column(
         Float, nullable=True, comment="Weighted overall brand score (0-100)"
     )
 
-    report = Column(JSON, nullable=True, comment="Complete analysis report data")
+    report = Column(JSONType, nullable=True, comment="Complete analysis report data")
 
     pdf_url = Column(
         String(2048), nullable=True, comment="URL to the generated PDF report"
@@ -284,14 +332,52 @@ class Analysis(Base):
     __table_args__ = (
         # Index for finding recent analyses
         Index("ix_analyses_created_at", created_at.desc()),
-        # Index for finding analyses by status
-        Index("ix_analyses_status_created", status, created_at.desc()),
+        # Partial index for polling in-flight jobs; stays small as history grows
+        Index(
+            "ix_analyses_active",
+            created_at.desc(),
+            postgresql_where=status.in_(
+                [AnalysisStatusEnum.PENDING, AnalysisStatusEnum.PROCESSING]
+            ),
+            sqlite_where=status.in_(
+                [AnalysisStatusEnum.PENDING, AnalysisStatusEnum.PROCESSING]
+            ),
+        ),
+        # Containment (@>) lookups inside report/scores (PostgreSQL only)
+        Index(
+            "ix_analyses_report_gin",
+            report,
+            postgresql_using="gin",
+            postgresql_ops={"report": "jsonb_path_ops"},
+        ).ddl_if(dialect="postgresql"),
+        Index(
+            "ix_analyses_scores_gin",
+            scores,
+            postgresql_using="gin",
+            postgresql_ops={"scores": "jsonb_path_ops"},
+        ).ddl_if(dialect="postgresql"),
     )
 
     def __repr__(self) -> str:
         return f"<Analysis(id={self.id}, url={self.url}, status={self.status})>"
 
 
+# data_type values written to analysis_cache (mirrors CacheManager prefixes).
+# Their payloads have unrelated shapes, so each gets its own partial GIN index.
+CACHE_DATA_TYPES = ("pagespeed", "serp", "twitter", "wikipedia", "openai")
+
+
+def _cache_data_gin_index(data_type: str) -> Index:
+    """Build the partial jsonb_path_ops GIN index for one cache data_type."""
+    return Index(
+        f"ix_cache_data_{data_type}",
+        "data",
+        postgresql_using="gin",
+        postgresql_ops={"data": "jsonb_path_ops"},
+        postgresql_where=text(f"data_type = '{data_type}'"),
+    ).ddl_if(dialect="postgresql")
+
+
 class AnalysisCache(Base):
     """
     Cache table for storing scraped data and API responses.
@@ -307,6 +393,13 @@ class AnalysisCache(Base):
         data: The cached JSON data
         expires_at: When this cache entry expires
         created_at: When the cache entry was created
+
+    On PostgreSQL the table is range-partitioned by day on expires_at, so
+    expired entries are evicted by dropping whole partitions (see
+    maintain_cache_partitions) instead of row-by-row DELETEs. Because every
+    unique constraint must include the partition key, expires_at is part of
+    the primary key and cache_key is not globally unique there; readers
+    take the newest unexpired row for a key.
     """
 
     __tablename__ = "analysis_cache"
@@ -319,9 +412,7 @@ class AnalysisCache(Base):
 
     cache_key = Column(
         String(512),
-        unique=True,
         nullable=False,
-        index=True,
         comment="Unique cache key (hash of URL + data type)",
     )
 
@@ -329,10 +420,14 @@ class AnalysisCache(Base):
 
     data_type = Column(String(50), nullable=False, comment="Type of cached data")
 
-    data = Column(JSON, nullable=False, comment="Cached response data")
+    data = Column(JSONType, nullable=False, comment="Cached response data")
 
     expires_at = Column(
-        DateTime, nullable=False, index=True, comment="Cache expiration timestamp"
+        DateTime,
+        primary_key=True,
+        nullable=False,
+        index=True,
+        comment="Cache expiration timestamp (partition key)",
     )
 
     created_at = Column(
@@ -341,12 +436,38 @@ class AnalysisCache(Base):
         nullable=False,
     )
 
-    __table_args__ = (Index("ix_cache_url_type", url, data_type),)
+    __table_args__ = (
+        Index("ix_cache_url_type", url, data_type),
+        # Key lookup; expires_at rides along for index-only freshness checks
+        Index(
+            "ix_cache_key_covering",
+            cache_key,
+            postgresql_include=["expires_at"],
+        ),
+        # Compact hash index for equality-only key probes
+        Index("ix_cache_key_hash", cache_key, postgresql_using="hash"),
+        # Containment (@>) lookups on data, one partial index per data_type
+        *(_cache_data_gin_index(data_type) for data_type in CACHE_DATA_TYPES),
+        {"postgresql_partition_by": "RANGE (expires_at)"},
+    )
 
     def __repr__(self) -> str:
         return f"<AnalysisCache(key={self.cache_key}, type={self.data_type})>"
 
 
+# A partitioned table accepts no rows until some partition covers them, so a
+# table built by metadata.create_all() gets the same DEFAULT partition that
+# migration 007 creates; maintain_cache_partitions adds the daily ones.
+event.listen(
+    AnalysisCache.__table__,
+    "after_create",
+    DDL(
+        "CREATE TABLE IF NOT EXISTS analysis_cache_default "
+        "PARTITION OF analysis_cache DEFAULT"
+    ).execute_if(dialect="postgresql"),
+)
+
+
 class UserRoleEnum(str, enum.Enum):
     USER = "user"
     ADMIN = "admin"
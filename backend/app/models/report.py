@@ -9,7 +9,7 @@ from datetime import datetime
 from typing import Optional, List, Dict, Any
 from enum import Enum
 
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field
 
 from app.models.enhanced_scoring import (
     NormalizedScore,
@@ -45,6 +45,10 @@ class Recommendation(BaseModel):
         effort: Estimated effort to implement (high/medium/low)
     """
 
+    # Immutable once emitted, so report sections can embed the same instance
+    # without copying or re-validating it.
+    model_config = ConfigDict(frozen=True)
+
     title: str = Field(..., max_length=200)
     description: str
     priority: SeverityLevel = SeverityLevel.MEDIUM
@@ -64,6 +68,8 @@ class Finding(BaseModel):
         data: Optional associated data (metrics, values, etc.)
     """
 
+    model_config = ConfigDict(frozen=True)
+
     title: str
     detail: str
     severity: SeverityLevel = SeverityLevel.INFO
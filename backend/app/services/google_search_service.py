@@ -23,12 +23,13 @@
 # =============================================================================
 
 from typing import Dict, Any, Optional, List
-from dataclasses import dataclass, field
-import httpx
+from dataclasses import asdict, dataclass, field
 import asyncio
 import logging
 
 from app.config import settings
+from app.utils.cache import cache, rate_limiters
+from app.utils.http_client import get_shared_client
 
 logger = logging.getLogger(__name__)
 
@@ -86,6 +87,9 @@ class GoogleSearchService:
     API_URL = "https://www.googleapis.com/customsearch/v1"
     TIMEOUT = 15
     MAX_RETRIES = 2
+    CACHE_TTL = cache.DEFAULT_TTLS["serp"]
+    # Longest wait for a rate-limit slot before a request is skipped
+    QUOTA_WAIT = 5
 
     # Social media domains to detect in search results
     # Presence here indicates strong "Brand SEO"
@@ -115,6 +119,25 @@ class GoogleSearchService:
         self.api_key = api_key or settings.GOOGLE_API_KEY
         self.search_engine_id = search_engine_id or settings.GOOGLE_SEARCH_ENGINE_ID
 
+    async def _acquire_quota(self) -> bool:
+        """
+        Take a slot from the shared Custom Search rate limit.
+
+        The limiter lives in Redis, so it caps calls across all API and
+        worker processes rather than per event loop. Bursts above the limit
+        wait for a slot, for at most QUOTA_WAIT seconds.
+
+        Returns:
+            bool: False if the request should be skipped
+        """
+        rate_limiter = rate_limiters.get("google_search")
+        if rate_limiter and not await rate_limiter.wait_if_needed(
+            timeout=self.QUOTA_WAIT
+        ):
+            logger.warning("Google Search API rate limit reached, skipping request")
+            return False
+        return True
+
     async def search_brand(
         self,
         brand_name: str,
@@ -140,33 +163,57 @@ class GoogleSearchService:
             "num": min(num_results, 10),
         }
 
+        # Only real API responses are cached; mock and error results are not
+        cache_key = cache._make_key(
+            "serp", "brand", brand_name, brand_domain, params["num"]
+        )
+        cached_result = await cache.get(cache_key)
+        if cached_result is not None:
+            logger.debug(f"SERP cache hit for {brand_name}")
+            cached_result["results"] = [
+                SearchResult(**result) for result in cached_result["results"]
+            ]
+            return SERPAnalysis(**cached_result)
+
+        # Check rate limit (cache hits above don't count against it)
+        if not await self._acquire_quota():
+            return SERPAnalysis(
+                success=False,
+                query=brand_name,
+                error="Rate limited by Google Search API",
+            )
+
         try:
-            async with httpx.AsyncClient(timeout=self.TIMEOUT) as client:
-                response = await client.get(self.API_URL, params=params)
-
-                if response.status_code == 200:
-                    data = response.json()
-                    return self._parse_serp_response(brand_name, brand_domain, data)
-
-                elif response.status_code == 429:
-                    logger.warning("Google Search API rate limited")
-                    return SERPAnalysis(
-                        success=False,
-                        query=brand_name,
-                        error="Rate limited by Google Search API",
-                    )
-
-                elif response.status_code == 403:
-                    logger.error("Google Search API access denied")
-                    return SERPAnalysis(
-                        success=False,
-                        query=brand_name,
-                        error="API access denied - check API key and quota",
-                    )
-
-                else:
-                    logger.error(f"Google Search API error: {response.status_code}")
-                    return self._get_mock_serp(brand_name, brand_domain)
+            client = get_shared_client()
+            response = await client.get(
+                self.API_URL, params=params, timeout=self.TIMEOUT
+            )
+
+            if response.status_code == 200:
+                data = response.json()
+                serp = self._parse_serp_response(brand_name, brand_domain, data)
+                await cache.set(cache_key, asdict(serp), ttl=self.CACHE_TTL)
+                return serp
+
+            elif response.status_code == 429:
+                logger.warning("Google Search API rate limited")
+                return SERPAnalysis(
+                    success=False,
+                    query=brand_name,
+                    error="Rate limited by Google Search API",
+                )
+
+            elif response.status_code == 403:
+                logger.error("Google Search API access denied")
+                return SERPAnalysis(
+                    success=False,
+                    query=brand_name,
+                    error="API access denied - check API key and quota",
+                )
+
+            else:
+                logger.error(f"Google Search API error: {response.status_code}")
+                return self._get_mock_serp(brand_name, brand_domain)
 
         except Exception as e:
             logger.error(f"Google Search request failed: {e}")
@@ -197,17 +244,22 @@ class GoogleSearchService:
             "num": 10,
         }
 
+        if not await self._acquire_quota():
+            return self._get_mock_indexing(domain)
+
         try:
-            async with httpx.AsyncClient(timeout=self.TIMEOUT) as client:
-                response = await client.get(self.API_URL, params=params)
+            client = get_shared_client()
+            response = await client.get(
+                self.API_URL, params=params, timeout=self.TIMEOUT
+            )
 
-                if response.status_code == 200:
-                    data = response.json()
-                    return self._parse_indexing_response(domain, data)
+            if response.status_code == 200:
+                data = response.json()
+                return self._parse_indexing_response(domain, data)
 
-                else:
-                    logger.error(f"Indexing check failed: {response.status_code}")
-                    return self._get_mock_indexing(domain)
+            else:
+                logger.error(f"Indexing check failed: {response.status_code}")
+                return self._get_mock_indexing(domain)
 
         except Exception as e:
             logger.error(f"Indexing check request failed: {e}")
@@ -231,33 +283,38 @@ class GoogleSearchService:
             "num": 5,
         }
 
+        if not await self._acquire_quota():
+            return {"found": False, "url": None, "title": None}
+
         try:
-            async with httpx.AsyncClient(timeout=self.TIMEOUT) as client:
-                response = await client.get(self.API_URL, params=params)
-
-                if response.status_code == 200:
-                    data = response.json()
-                    items = data.get("items", [])
-
-                    for item in items:
-                        link = item.get("link", "")
-                        title = item.get("title", "")
-
-                        # Check if it's a Wikipedia article (not a talk page, category, etc.)
-                        if (
-                            "wikipedia.org/wiki/" in link
-                            and ":" not in link.split("/wiki/")[-1]
-                        ):
-                            # Check if brand name is in title to avoid false positives
-                            if brand_name.lower() in title.lower():
-                                return {
-                                    "found": True,
-                                    "url": link,
-                                    "title": title,
-                                    "snippet": item.get("snippet", ""),
-                                }
-
-                    return {"found": False, "url": None, "title": None}
+            client = get_shared_client()
+            response = await client.get(
+                self.API_URL, params=params, timeout=self.TIMEOUT
+            )
+
+            if response.status_code == 200:
+                data = response.json()
+                items = data.get("items", [])
+
+                for item in items:
+                    link = item.get("link", "")
+                    title = item.get("title", "")
+
+                    # Check if it's a Wikipedia article (not a talk page, category, etc.)
+                    if (
+                        "wikipedia.org/wiki/" in link
+                        and ":" not in link.split("/wiki/")[-1]
+                    ):
+                        # Check if brand name is in title to avoid false positives
+                        if brand_name.lower() in title.lower():
+                            return {
+                                "found": True,
+                                "url": link,
+                                "title": title,
+                                "snippet": item.get("snippet", ""),
+                            }
+
+                return {"found": False, "url": None, "title": None}
 
         except Exception as e:
             logger.error(f"Wikipedia check failed: {e}")
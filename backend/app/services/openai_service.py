@@ -34,6 +34,8 @@ from tenacity import (
 )
 
 from app.config import settings
+from app.utils.cache import cache
+from app.utils.http_client import get_shared_client
 
 logger = logging.getLogger(__name__)
 
@@ -103,6 +105,46 @@ class ContentThemeAnalysis:
     sentiment_score: float = 0.0
 
 
+# Structured-output format for archetype responses. In strict mode the API
+# guarantees this shape, and the enums keep archetype names to the keys of
+# OpenAIService.ARCHETYPE_INFO.
+_ARCHETYPE_NAMES = [archetype.value for archetype in BrandArchetype]
+
+ARCHETYPE_RESPONSE_FORMAT = {
+    "type": "json_schema",
+    "json_schema": {
+        "name": "brand_archetype",
+        "strict": True,
+        "schema": {
+            "type": "object",
+            "properties": {
+                "primary_archetype": {"type": "string", "enum": _ARCHETYPE_NAMES},
+                "secondary_archetype": {
+                    "type": ["string", "null"],
+                    "enum": [*_ARCHETYPE_NAMES, None],
+                },
+                "confidence": {"type": "number"},
+                "reasoning": {"type": "string"},
+                "key_indicators": {"type": "array", "items": {"type": "string"}},
+                "brand_personality_traits": {
+                    "type": "array",
+                    "items": {"type": "string"},
+                },
+            },
+            "required": [
+                "primary_archetype",
+                "secondary_archetype",
+                "confidence",
+                "reasoning",
+                "key_indicators",
+                "brand_personality_traits",
+            ],
+            "additionalProperties": False,
+        },
+    },
+}
+
+
 class OpenAIService:
     """
     Comprehensive OpenAI service for brand analysis.
@@ -112,6 +154,7 @@ class OpenAIService:
 
     API_URL = "https://api.openai.com/v1/chat/completions"
     TIMEOUT = 60
+    CACHE_TTL = cache.DEFAULT_TTLS["openai"]
 
     # Archetype descriptions for context
     # These are passed to the frontend or used in report generation
@@ -239,6 +282,7 @@ class OpenAIService:
         temperature: float = 0.3,
         max_tokens: int = 1500,
         json_mode: bool = True,
+        response_format: Optional[Dict[str, Any]] = None,
     ) -> Optional[Dict[str, Any]]:
         """
         Make a call to the OpenAI API with retry logic.
@@ -254,6 +298,8 @@ class OpenAIService:
             temperature: Creativity level (0-1)
             max_tokens: Maximum response tokens
             json_mode: Whether to enforce JSON response
+            response_format: Explicit response format (e.g. a JSON schema),
+                used instead of plain JSON mode
         """
         if not self.api_key:
             logger.warning("OpenAI API key not configured")
@@ -271,39 +317,52 @@ class OpenAIService:
             "max_tokens": max_tokens,
         }
 
-        if json_mode:
+        if response_format:
+            request_body["response_format"] = response_format
+        elif json_mode:
             request_body["response_format"] = {"type": "json_object"}
 
-        async with httpx.AsyncClient(timeout=self.TIMEOUT) as client:
-            response = await client.post(
-                self.API_URL,
-                headers={
-                    "Authorization": f"Bearer {self.api_key}",
-                    "Content-Type": "application/json",
-                },
-                json=request_body,
-            )
+        # The key covers the model and full prompt, so a re-run of the same
+        # page reuses the answer while any prompt or model change misses
+        cache_key = cache._make_key("openai", request_body)
+        cached_result = await cache.get(cache_key)
+        if cached_result is not None:
+            logger.debug("OpenAI cache hit")
+            return cached_result
+
+        client = get_shared_client()
+        response = await client.post(
+            self.API_URL,
+            headers={
+                "Authorization": f"Bearer {self.api_key}",
+                "Content-Type": "application/json",
+            },
+            json=request_body,
+            timeout=self.TIMEOUT,
+        )
 
-            # Raise exception for 4xx/5xx to trigger retry
-            # Note: We might want to avoid retrying 400 Bad Request, but 429/500/503 are good to retry
-            if response.status_code in [429, 500, 502, 503, 504]:
-                response.raise_for_status()
-            elif response.status_code != 200:
-                logger.error(
-                    f"OpenAI API error: {response.status_code} - {response.text}"
-                )
-                return None
+        # Raise exception for 4xx/5xx to trigger retry
+        # Note: We might want to avoid retrying 400 Bad Request, but 429/500/503 are good to retry
+        if response.status_code in [429, 500, 502, 503, 504]:
+            response.raise_for_status()
+        elif response.status_code != 200:
+            logger.error(f"OpenAI API error: {response.status_code} - {response.text}")
+            return None
 
-            result = response.json()
-            content = result["choices"][0]["message"]["content"]
+        result = response.json()
+        content = result["choices"][0]["message"]["content"]
 
-            if json_mode:
-                try:
-                    return json.loads(content)
-                except json.JSONDecodeError:
-                    logger.error("Failed to decode JSON from OpenAI response")
-                    return None
-            return {"text": content}
+        if json_mode:
+            try:
+                parsed = json.loads(content)
+            except json.JSONDecodeError:
+                logger.error("Failed to decode JSON from OpenAI response")
+                return None
+        else:
+            parsed = {"text": content}
+
+        await cache.set(cache_key, parsed, ttl=self.CACHE_TTL)
+        return parsed
 
     async def analyze_archetype(
         self,
@@ -341,7 +400,9 @@ Respond with JSON:
 }}"""
 
         try:
-            result = await self._call_api(prompt, system_prompt)
+            result = await self._call_api(
+                prompt, system_prompt, response_format=ARCHETYPE_RESPONSE_FORMAT
+            )
         except Exception as e:
             logger.error(f"Archetype analysis failed after retries: {e}")
             result = None
@@ -7,11 +7,13 @@
 # =============================================================================
 
 from typing import Dict, Any, Optional, List
-from dataclasses import dataclass, field
+from dataclasses import asdict, dataclass, field
 from urllib.parse import quote
-import httpx
 import logging
 
+from app.utils.cache import cache
+from app.utils.http_client import get_shared_client
+
 logger = logging.getLogger(__name__)
 
 
@@ -21,7 +23,7 @@ class WikipediaArticle:
 
     title: str
     page_id: int
-    extract: str = ""  # Summary text
+    extract: str = ""  # Summary text (truncated to MAX_EXTRACT_CHARS)
     description: str = ""  # Short description
     url: str = ""
     thumbnail_url: Optional[str] = None
@@ -71,6 +73,13 @@ class WikipediaService:
     SUMMARY_API = "https://en.wikipedia.org/api/rest_v1/page/summary/{title}"
     SEARCH_API = "https://en.wikipedia.org/w/api.php"
     TIMEOUT = 15
+    # Callers only show the start of the summary; content_length keeps the
+    # full length for notability scoring
+    MAX_EXTRACT_CHARS = 500
+    CACHE_TTL = cache.DEFAULT_TTLS["wikipedia"]
+    # Validators outlive the cached summary so an expired entry can be
+    # revalidated with a conditional request instead of re-downloaded
+    VALIDATOR_TTL = CACHE_TTL * 4
     USER_AGENT = "BrandAnalytics/1.0 (https://github.com/brand-analytics; contact@brand-analytics.io)"
 
     async def check_brand_presence(
@@ -165,49 +174,86 @@ class WikipediaService:
         title = title.strip().replace(" ", "_")
         url = self.SUMMARY_API.format(title=quote(title))
 
+        # An empty dict is cached for missing articles so 404s aren't re-fetched
+        cache_key = cache._make_key("wikipedia", "summary", title)
+        cached_result = await cache.get(cache_key)
+        if cached_result is not None:
+            logger.debug(f"Wikipedia cache hit for {title}")
+            return WikipediaArticle(**cached_result) if cached_result else None
+
+        # ETag/Last-Modified from the last full response, used to revalidate
+        validator_key = cache._make_key("wikipedia", "validator", title)
+        validator = await cache.get(validator_key)
+
+        headers = {
+            "Accept": "application/json",
+            "User-Agent": self.USER_AGENT,
+        }
+        if validator:
+            if validator.get("etag"):
+                headers["If-None-Match"] = validator["etag"]
+            if validator.get("last_modified"):
+                headers["If-Modified-Since"] = validator["last_modified"]
+
         try:
-            async with httpx.AsyncClient(timeout=self.TIMEOUT) as client:
-                response = await client.get(
-                    url,
-                    headers={
-                        "Accept": "application/json",
-                        "User-Agent": self.USER_AGENT,
-                    },
+            client = get_shared_client()
+            response = await client.get(url, headers=headers, timeout=self.TIMEOUT)
+
+            if response.status_code == 304 and validator:
+                # Unchanged since the last fetch; reuse the stored article
+                logger.debug(f"Wikipedia article not modified: {title}")
+                await cache.set(cache_key, validator["article"], ttl=self.CACHE_TTL)
+                return WikipediaArticle(**validator["article"])
+
+            elif response.status_code == 200:
+                data = response.json()
+
+                # Check article type
+                article_type = data.get("type", "")
+                is_disambiguation = article_type == "disambiguation"
+                is_redirect = "redirects" in data
+
+                # Get thumbnail
+                thumbnail = data.get("thumbnail", {})
+                thumbnail_url = thumbnail.get("source") if thumbnail else None
+
+                extract = data.get("extract", "")
+                article = WikipediaArticle(
+                    title=data.get("title", title),
+                    page_id=data.get("pageid", 0),
+                    extract=extract[: self.MAX_EXTRACT_CHARS],
+                    description=data.get("description", ""),
+                    url=data.get("content_urls", {}).get("desktop", {}).get("page", ""),
+                    thumbnail_url=thumbnail_url,
+                    is_disambiguation=is_disambiguation,
+                    is_redirect=is_redirect,
+                    content_length=len(extract),
                 )
-
-                if response.status_code == 200:
-                    data = response.json()
-
-                    # Check article type
-                    article_type = data.get("type", "")
-                    is_disambiguation = article_type == "disambiguation"
-                    is_redirect = "redirects" in data
-
-                    # Get thumbnail
-                    thumbnail = data.get("thumbnail", {})
-                    thumbnail_url = thumbnail.get("source") if thumbnail else None
-
-                    return WikipediaArticle(
-                        title=data.get("title", title),
-                        page_id=data.get("pageid", 0),
-                        extract=data.get("extract", ""),
-                        description=data.get("description", ""),
-                        url=data.get("content_urls", {})
-                        .get("desktop", {})
-                        .get("page", ""),
-                        thumbnail_url=thumbnail_url,
-                        is_disambiguation=is_disambiguation,
-                        is_redirect=is_redirect,
-                        content_length=len(data.get("extract", "")),
+                article_data = asdict(article)
+                await cache.set(cache_key, article_data, ttl=self.CACHE_TTL)
+
+                etag = response.headers.get("ETag")
+                last_modified = response.headers.get("Last-Modified")
+                if etag or last_modified:
+                    await cache.set(
+                        validator_key,
+                        {
+                            "etag": etag,
+                            "last_modified": last_modified,
+                            "article": article_data,
+                        },
+                        ttl=self.VALIDATOR_TTL,
                     )
+                return article
 
-                elif response.status_code == 404:
-                    # Article doesn't exist
-                    return None
+            elif response.status_code == 404:
+                # Article doesn't exist
+                await cache.set(cache_key, {}, ttl=self.CACHE_TTL)
+                return None
 
-                else:
-                    logger.error(f"Wikipedia API error: {response.status_code}")
-                    return None
+            else:
+                logger.error(f"Wikipedia API error: {response.status_code}")
+                return None
 
         except Exception as e:
             logger.error(f"Wikipedia article fetch failed: {e}")
@@ -233,19 +279,28 @@ class WikipediaService:
             "utf8": 1,
         }
 
+        cache_key = cache._make_key("wikipedia", "search", query, limit)
+        cached_result = await cache.get(cache_key)
+        if cached_result is not None:
+            logger.debug(f"Wikipedia search cache hit for {query}")
+            return cached_result
+
         try:
-            async with httpx.AsyncClient(timeout=self.TIMEOUT) as client:
-                response = await client.get(
-                    self.SEARCH_API,
-                    params=params,
-                    headers={"User-Agent": self.USER_AGENT},
-                )
+            client = get_shared_client()
+            response = await client.get(
+                self.SEARCH_API,
+                params=params,
+                headers={"User-Agent": self.USER_AGENT},
+                timeout=self.TIMEOUT,
+            )
 
-                if response.status_code == 200:
-                    data = response.json()
-                    return data.get("query", {}).get("search", [])
+            if response.status_code == 200:
+                data = response.json()
+                results = data.get("query", {}).get("search", [])
+                await cache.set(cache_key, results, ttl=self.CACHE_TTL)
+                return results
 
-                return []
+            return []
 
         except Exception as e:
             logger.error(f"Wikipedia search failed: {e}")
@@ -266,30 +321,33 @@ class WikipediaService:
             "titles": title,
             "prop": "categories",
             "cllimit": 50,
+            "redirects": 1,
             "format": "json",
+            # v2 returns pages as a list with an explicit "missing" flag
+            "formatversion": 2,
         }
 
         try:
-            async with httpx.AsyncClient(timeout=self.TIMEOUT) as client:
-                response = await client.get(
-                    self.SEARCH_API,
-                    params=params,
-                    headers={"User-Agent": self.USER_AGENT},
-                )
+            client = get_shared_client()
+            response = await client.get(
+                self.SEARCH_API,
+                params=params,
+                headers={"User-Agent": self.USER_AGENT},
+                timeout=self.TIMEOUT,
+            )
 
-                if response.status_code == 200:
-                    data = response.json()
-                    pages = data.get("query", {}).get("pages", {})
+            if response.status_code == 200:
+                data = response.json()
+                pages = data.get("query", {}).get("pages", [])
 
-                    for page_id, page_data in pages.items():
-                        if page_id != "-1":
-                            categories = page_data.get("categories", [])
-                            return [
-                                cat.get("title", "").replace("Category:", "")
-                                for cat in categories
-                            ]
+                if pages and not pages[0].get("missing", False):
+                    categories = pages[0].get("categories", [])
+                    return [
+                        cat.get("title", "").replace("Category:", "")
+                        for cat in categories
+                    ]
 
-                return []
+            return []
 
         except Exception as e:
             logger.error(f"Wikipedia categories fetch failed: {e}")
@@ -158,7 +158,7 @@ class X402Service:
         # Prepare Authorization Data
         valid_after = 0
         valid_before = int(invoice.deadline.timestamp())
-        value = invoice.amount_atomic
+        value = int(invoice.amount_atomic)  # NUMERIC(78,0) loads as Decimal
         nonce = invoice.nonce
 
         authorization = {
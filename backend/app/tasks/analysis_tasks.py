@@ -10,7 +10,7 @@ from datetime import datetime
 from typing import Dict, Any
 import traceback
 
-from sqlalchemy import select
+from sqlalchemy import func, select, update
 from sqlalchemy.ext.asyncio import create_async_engine, AsyncSession, async_sessionmaker
 
 from app.config import settings
@@ -71,6 +71,22 @@ async def update_progress(
     from uuid import UUID
 
     async with session_factory() as progress_session:
+        if progress_session.bind.dialect.name == "postgresql":
+            # Merge the key in a single statement: no SELECT round-trip, and
+            # modules finishing together in a wave can't overwrite each other
+            await progress_session.execute(
+                update(Analysis)
+                .where(Analysis.id == UUID(analysis_id))
+                .values(
+                    progress=Analysis.progress.op("||")(
+                        func.jsonb_build_object(module, status)
+                    ),
+                    updated_at=datetime.utcnow(),
+                )
+            )
+            await progress_session.commit()
+            return
+
         result = await progress_session.execute(
             select(Analysis).where(Analysis.id == UUID(analysis_id))
         )
@@ -137,6 +153,7 @@ async def _run_analysis_async(analysis_id: str) -> Dict[str, Any]:
     """
     from uuid import UUID
     from app.analyzers.orchestrator import AnalysisOrchestrator
+    from app.utils.http_client import close_shared_client
 
     # Get database session
     session_factory = get_task_db_session()
@@ -263,6 +280,10 @@ async def _run_analysis_async(analysis_id: str) -> Dict[str, Any]:
                 "error": error_message,
             }
 
+        finally:
+            # Pooled HTTP clients are bound to this run's event loop
+            await close_shared_client()
+
 
 # =============================================================================
 # Register as Celery Task
@@ -316,3 +337,180 @@ def cleanup_old_analyses(days: int = 30) -> Dict[str, int]:
     # Implementation would go here
     # For now, just return a placeholder
     return {"deleted_analyses": 0, "deleted_cache_entries": 0}
+
+
+# =============================================================================
+# Cache Partition Maintenance
+# =============================================================================
+# On PostgreSQL, analysis_cache is range-partitioned by day on expires_at
+# (see migration 007). Eviction is a DROP TABLE of any partition whose whole
+# range has already expired, which avoids DELETE churn and vacuum bloat.
+CACHE_PARTITION_PREFIX = "analysis_cache_p"
+CACHE_DEFAULT_PARTITION = "analysis_cache_default"
+CACHE_PARTITION_DAYS_AHEAD = 14
+
+
+async def _maintain_cache_partitions_async(days_ahead: int) -> Dict[str, int]:
+    """
+    Create upcoming daily cache partitions and drop fully expired ones.
+
+    Days are UTC days, matching the naive UTC expires_at values. Expired rows
+    in the DEFAULT partition are deleted, and rows it holds for a day that
+    is about to get its own partition are moved into it, since PostgreSQL
+    refuses to attach a range the DEFAULT partition already has rows for.
+
+    Args:
+        days_ahead: Number of future days that should have a partition
+
+    Returns:
+        dict: Number of partitions created and dropped, and number of
+        expired rows deleted from the DEFAULT partition
+    """
+    from datetime import timedelta
+    from sqlalchemy import text
+
+    created = dropped = 0
+    session_factory = get_task_db_session()
+
+    async with session_factory() as session:
+        if session.bind.dialect.name != "postgresql":
+            return {
+                "created_partitions": 0,
+                "dropped_partitions": 0,
+                "deleted_default_rows": 0,
+            }
+
+        result = await session.execute(
+            text(
+                "SELECT c.relname FROM pg_inherits i "
+                "JOIN pg_class c ON c.oid = i.inhrelid "
+                "JOIN pg_class p ON p.oid = i.inhparent "
+                "WHERE p.relname = 'analysis_cache'"
+            )
+        )
+        existing = {
+            name for name in result.scalars() if name.startswith(CACHE_PARTITION_PREFIX)
+        }
+
+        now = datetime.utcnow()
+        today = now.date()
+
+        # A partition for day D holds rows expiring in [D, D + 1); once D is
+        # in the past every row in it is stale.
+        for name in sorted(existing):
+            day = datetime.strptime(name[len(CACHE_PARTITION_PREFIX) :], "%Y%m%d")
+            if day.date() < today:
+                await session.execute(text(f'DROP TABLE IF EXISTS "{name}"'))
+                dropped += 1
+
+        # Rows outside the partition window land in DEFAULT; evict the stale ones
+        result = await session.execute(
+            text(f"DELETE FROM {CACHE_DEFAULT_PARTITION} WHERE expires_at <= :now"),
+            {"now": now},
+        )
+        deleted = result.rowcount
+
+        for offset in range(days_ahead + 1):
+            start = today + timedelta(days=offset)
+            name = f"{CACHE_PARTITION_PREFIX}{start:%Y%m%d}"
+            if name in existing:
+                continue
+            end = start + timedelta(days=1)
+            bounds = {"start": start, "end": end}
+
+            # Park any DEFAULT rows for this day, then reinsert them through
+            # the parent once the new partition can take them
+            await session.execute(
+                text(
+                    "CREATE TEMP TABLE cache_partition_rows ON COMMIT DROP AS "
+                    f"SELECT * FROM {CACHE_DEFAULT_PARTITION} "
+                    "WHERE expires_at >= :start AND expires_at < :end"
+                ),
+                bounds,
+            )
+            await session.execute(
+                text(
+                    f"DELETE FROM {CACHE_DEFAULT_PARTITION} "
+                    "WHERE expires_at >= :start AND expires_at < :end"
+                ),
+                bounds,
+            )
+            await session.execute(
+                text(
+                    f'CREATE TABLE IF NOT EXISTS "{name}" PARTITION OF analysis_cache '
+                    f"FOR VALUES FROM ('{start.isoformat()}') TO ('{end.isoformat()}')"
+                )
+            )
+            await session.execute(
+                text("INSERT INTO analysis_cache SELECT * FROM cache_partition_rows")
+            )
+            await session.execute(text("DROP TABLE cache_partition_rows"))
+            created += 1
+
+        await session.commit()
+
+    return {
+        "created_partitions": created,
+        "dropped_partitions": dropped,
+        "deleted_default_rows": deleted,
+    }
+
+
+@celery_app.task(name="maintain_cache_partitions")
+def maintain_cache_partitions(
+    days_ahead: int = CACHE_PARTITION_DAYS_AHEAD,
+) -> Dict[str, int]:
+    """
+    Roll the analysis_cache partition window forward.
+
+    Args:
+        days_ahead: Number of future days that should have a partition
+
+    Returns:
+        dict: Number of partitions created and dropped, and number of
+        expired rows deleted from the DEFAULT partition
+    """
+    return asyncio.run(_maintain_cache_partitions_async(days_ahead))
+
+
+# =============================================================================
+# Dashboard Rollups
+# =============================================================================
+# analyses_daily_rollup (see migration 010) is a materialized view of
+# per-day, per-status counts. It is refreshed CONCURRENTLY so readers are
+# never blocked while it rebuilds.
+ANALYSES_ROLLUP_VIEW = "analyses_daily_rollup"
+
+
+async def _refresh_analyses_rollup_async() -> bool:
+    """
+    Refresh the analyses daily rollup view.
+
+    Returns:
+        bool: True if the view was refreshed (PostgreSQL only)
+    """
+    from sqlalchemy import text
+
+    session_factory = get_task_db_session()
+
+    async with session_factory() as session:
+        if session.bind.dialect.name != "postgresql":
+            return False
+
+        await session.execute(
+            text(f"REFRESH MATERIALIZED VIEW CONCURRENTLY {ANALYSES_ROLLUP_VIEW}")
+        )
+        await session.commit()
+
+    return True
+
+
+@celery_app.task(name="refresh_analyses_rollup")
+def refresh_analyses_rollup() -> Dict[str, bool]:
+    """
+    Refresh the dashboard rollup of analyses per day and status.
+
+    Returns:
+        dict: Whether the view was refreshed
+    """
+    return {"refreshed": asyncio.run(_refresh_analyses_rollup_async())}
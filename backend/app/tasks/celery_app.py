@@ -78,12 +78,22 @@ celery_app.conf.update(
     task_default_queue="default",
     # Beat Schedule (for periodic tasks - if needed)
     # -------------------------------------------------------------------------
-    # beat_schedule={
-    #     "cleanup-old-analyses": {
-    #         "task": "cleanup_old_analyses",
-    #         "schedule": 86400.0,  # Once per day
-    #     },
-    # },
+    beat_schedule={
+        # Create tomorrow's cache partitions and drop expired ones
+        "maintain-cache-partitions": {
+            "task": "maintain_cache_partitions",
+            "schedule": 3600.0 * 6,  # Several times a day, idempotent
+        },
+        # Keep the dashboard rollup view at most a few minutes stale
+        "refresh-analyses-rollup": {
+            "task": "refresh_analyses_rollup",
+            "schedule": 300.0,  # Every 5 minutes
+        },
+        # "cleanup-old-analyses": {
+        #     "task": "cleanup_old_analyses",
+        #     "schedule": 86400.0,  # Once per day
+        # },
+    },
 )
 
 
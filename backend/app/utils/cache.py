@@ -11,6 +11,7 @@ import json
 import hashlib
 import logging
 import asyncio
+import uuid
 
 import redis.asyncio as aioredis
 
@@ -55,6 +56,7 @@ class CacheManager:
         "twitter": 3600,  # 1 hour - Social data changes frequently
         "wikipedia": 3600 * 24 * 7,  # 1 week - Wikipedia rarely changes
         "openai": 3600 * 24,  # 24 hours - AI analysis results
+        "analyzer": 300,  # 5 minutes - Repeat runs against an unchanged scrape
         "default": 3600,  # 1 hour
     }
 
@@ -320,31 +322,55 @@ class RateLimiter:
             window_start = now - self.window
 
             # Add current request timestamp
+            member = f"{now}:{uuid.uuid4().hex[:8]}"
             pipe = redis.pipeline()
             pipe.zremrangebyscore(self.key, 0, window_start)  # Remove old entries
-            pipe.zadd(self.key, {str(now): now})  # Add current request
+            pipe.zadd(self.key, {member: now})  # Add current request
             pipe.zcard(self.key)  # Count requests in window
             pipe.expire(self.key, self.window + 1)  # Set key expiry
 
             results = await pipe.execute()
             current_count = results[2]
 
-            return current_count <= self.max_requests
+            if current_count > self.max_requests:
+                # Rejected requests must not occupy the window, or callers
+                # that keep retrying would never be let through again
+                await redis.zrem(self.key, member)
+                return False
+
+            return True
 
         except Exception as e:
             logger.warning(f"Rate limit check failed: {e}")
             return True  # Allow if error
 
-    async def wait_if_needed(self) -> None:
-        """Wait if rate limited, then allow."""
+    async def wait_if_needed(self, timeout: Optional[float] = None) -> bool:
+        """
+        Wait if rate limited, then allow.
+
+        Args:
+            timeout: Give up after this many seconds (None waits indefinitely)
+
+        Returns:
+            True once a slot was taken, False if the timeout ran out first
+        """
+        loop = asyncio.get_running_loop()
+        deadline = None if timeout is None else loop.time() + timeout
+        # Poll several times per window so short windows aren't overshot
+        interval = min(1.0, self.window / 4)
+
         while not await self.is_allowed():
-            await asyncio.sleep(1)
+            if deadline is not None and loop.time() + interval > deadline:
+                return False
+            await asyncio.sleep(interval)
+        return True
 
 
 # Pre-configured rate limiters for common APIs
 rate_limiters = {
     "google_pagespeed": RateLimiter("google_pagespeed", max_requests=25, window=60),
-    "google_search": RateLimiter("google_search", max_requests=10, window=60),
+    # Custom Search allows 10 queries per second per project
+    "google_search": RateLimiter("google_search", max_requests=10, window=1),
     "openai": RateLimiter("openai", max_requests=50, window=60),
     "twitter": RateLimiter("twitter", max_requests=100, window=60),
 }
@@ -1,5 +1,6 @@
 import asyncio
 import random
+import weakref
 from typing import TypeVar, Callable, Any, Optional
 from functools import wraps
 import logging
@@ -261,6 +262,29 @@ class ResilientHTTPClient:
         return response.json()
 
 
+# Keep-alive client shared by the API services, one per event loop. Analyses
+# run under asyncio.run() in worker threads and Celery tasks, and httpx
+# connections cannot be reused across loops. Pass timeout per request.
+_shared_clients: "weakref.WeakKeyDictionary" = weakref.WeakKeyDictionary()
+
+SHARED_CLIENT_LIMITS = httpx.Limits(max_keepalive_connections=32, max_connections=64)
+
+
+def get_shared_client() -> httpx.AsyncClient:
+    loop = asyncio.get_running_loop()
+    client = _shared_clients.get(loop)
+    if client is None or client.is_closed:
+        client = httpx.AsyncClient(limits=SHARED_CLIENT_LIMITS)
+        _shared_clients[loop] = client
+    return client
+
+
+async def close_shared_client() -> None:
+    client = _shared_clients.pop(asyncio.get_running_loop(), None)
+    if client is not None:
+        await client.aclose()
+
+
 _clients: dict[str, ResilientHTTPClient] = {}
 
 
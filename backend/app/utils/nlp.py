@@ -4,7 +4,7 @@
 # Natural language processing utilities for text analysis.
 # =============================================================================
 
-from typing import List, Dict
+from typing import Callable, Dict, FrozenSet, Iterable, List
 import re
 
 
@@ -127,11 +127,54 @@ def simple_sentiment(text: str) -> str:
 
     text_lower = text.lower()
 
-    positive_count = sum(1 for word in positive_words if word in text_lower)
-    negative_count = sum(1 for word in negative_words if word in text_lower)
+    positive_count = sum(map(text_lower.__contains__, positive_words))
+    negative_count = sum(map(text_lower.__contains__, negative_words))
 
     if positive_count > negative_count:
         return "positive"
     elif negative_count > positive_count:
         return "negative"
     return "neutral"
+
+
+def keyword_matcher(keywords: Iterable[str]) -> Callable[[str], FrozenSet[str]]:
+    """
+    Build a function returning which keywords occur in a (lowercased) text.
+
+    Replaces a separate `kw in text` scan per keyword with one pass of a
+    compiled pattern. The lookahead reports a match at every position, but
+    only the longest alternative per position, so each hit also credits the
+    keywords that are prefixes of it. The result equals
+    {kw for kw in keywords if kw in text}.
+
+    Args:
+        keywords: Lowercase keywords to look for
+
+    Returns:
+        Function mapping a lowercased text to the keywords it contains
+    """
+    keywords = sorted(set(keywords), key=len, reverse=True)
+    pattern = re.compile("(?=(" + "|".join(map(re.escape, keywords)) + "))")
+    implied = {
+        kw: frozenset(k for k in keywords if kw.startswith(k)) for kw in keywords
+    }
+
+    def match(text: str) -> FrozenSet[str]:
+        found = {m.group(1) for m in pattern.finditer(text)}
+        return frozenset().union(*(implied[kw] for kw in found))
+
+    return match
+
+
+# Words, including hyphenated compounds like "next-generation"
+_WORD_PATTERN = re.compile(r"[a-z0-9-]+")
+
+
+def word_tokens(text_lower: str) -> FrozenSet[str]:
+    """
+    Return the distinct words of an already lowercased text.
+
+    Checking keywords against these tokens matches whole words only, so
+    "api" is not found in "rapid" the way a substring search would find it.
+    """
+    return frozenset(_WORD_PATTERN.findall(text_lower))
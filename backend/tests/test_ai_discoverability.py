@@ -0,0 +1,459 @@
+# =============================================================================
+# AI Discoverability Analyzer Test Suite
+# =============================================================================
+# Regression tests for the offline parts of the AI discoverability analyzer
+# (schema audit, content depth, scoring) so optimizations keep behavior.
+#
+# Run with: pytest tests/test_ai_discoverability.py -v
+# =============================================================================
+
+import asyncio
+import threading
+from typing import Any, Dict
+
+from app.analyzers.ai_discoverability import (
+    AIDiscoverabilityAnalyzer,
+    BRAND_NOT_DETECTED_FINDING,
+    CONTENT_THREAD_MIN_CHARS,
+    MISSING_ORGANIZATION_SCHEMA_FINDING,
+    NO_WIKIPEDIA_FINDING,
+    WIKIPEDIA_NOTABILITY_REC,
+)
+from app.config import settings
+from app.services.google_search_service import GoogleSearchService
+from app.services.wikipedia_service import WikipediaPresence, WikipediaService
+from app.utils.cache import cache, rate_limiters
+
+
+def make_analyzer(**scraped: Any) -> AIDiscoverabilityAnalyzer:
+    return AIDiscoverabilityAnalyzer(
+        url="https://www.example.com", scraped_data=scraped
+    )
+
+
+# =============================================================================
+# Test _analyze_schema_markup()
+# =============================================================================
+
+
+class TestSchemaMarkup:
+    """Tests for Schema.org structured data detection."""
+
+    def test_no_schema(self):
+        """Test that no markup yields an empty result."""
+        schema = make_analyzer()._analyze_schema_markup()
+
+        assert schema["types"] == []
+        assert schema["count"] == 0
+        assert schema["schema_score"] == 0
+        assert not schema["has_organization"]
+
+    def test_types_deduplicated_in_order(self):
+        """Test that repeated types are reported once, in first-seen order."""
+        schemas = [
+            {"@type": "WebSite"},
+            {"@type": "Organization"},
+            {"@type": "WebSite"},
+            "not-a-dict",
+            {"name": "missing type"},
+        ]
+        schema = make_analyzer(schema_markup=schemas)._analyze_schema_markup()
+
+        assert schema["types"] == ["WebSite", "Organization"]
+        assert schema["count"] == 5
+
+    def test_list_valued_types_flattened(self):
+        """Test that a JSON-LD @type list contributes each of its types."""
+        schemas = [
+            {"@type": ["Organization", "Brand"]},
+            {"@type": "Brand"},
+            {"@type": ["FAQPage", 3]},
+        ]
+        schema = make_analyzer(schema_markup=schemas)._analyze_schema_markup()
+
+        assert schema["types"] == ["Organization", "Brand", "FAQPage"]
+        assert schema["has_organization"]
+        assert schema["has_faq"]
+
+    def test_full_score(self):
+        """Test that every recommended type plus variety caps at 100."""
+        schemas = [
+            {"@type": t}
+            for t in [
+                "Corporation",
+                "FAQPage",
+                "Product",
+                "BlogPosting",
+                "BreadcrumbList",
+            ]
+        ]
+        schema = make_analyzer(schema_markup=schemas)._analyze_schema_markup()
+
+        # 30 + 20 + 15 + 15 + 10 + 10 (more than 3 types)
+        assert schema["schema_score"] == 100
+        assert schema["has_organization"]
+        assert schema["has_faq"]
+        assert schema["has_product"]
+        assert schema["has_article"]
+
+    def test_partial_score(self):
+        """Test scoring with a subset of recommended types."""
+        schemas = [{"@type": "Organization"}, {"@type": "SoftwareApplication"}]
+        schema = make_analyzer(schema_markup=schemas)._analyze_schema_markup()
+
+        assert schema["schema_score"] == 45
+        assert not schema["has_faq"]
+
+
+# =============================================================================
+# Test _analyze_content_depth()
+# =============================================================================
+
+
+class TestContentDepth:
+    """Tests for content depth detection from navigation and text."""
+
+    def test_empty_site(self):
+        """Test that an empty site scores zero."""
+        content = make_analyzer()._analyze_content_depth()
+
+        assert content["score"] == 0
+        assert content["paragraph_count"] == 0
+        assert not any(
+            content[k] for k in ("has_blog", "has_docs", "has_resources", "has_about")
+        )
+
+    def test_nav_sections_detected_by_substring(self):
+        """Test that nav keywords match case-insensitively inside labels."""
+        nav = [
+            {"text": "Our Blog"},
+            {"text": "Developer Documentation"},
+            {"text": "FAQ"},
+            {"text": "Meet the Team"},
+            {"href": "/no-text"},
+        ]
+        content = make_analyzer(navigation=nav)._analyze_content_depth()
+
+        assert content["has_blog"]
+        assert content["has_docs"]
+        assert content["has_resources"]
+        assert content["has_about"]
+        # 2 + 2 + 1 + 1
+        assert content["score"] == 6
+
+    def test_word_count_and_paragraphs(self):
+        """Test word count tiers and long-paragraph counting."""
+        long_paragraph = "x" * 101
+        text = "\n\n".join([long_paragraph] * 5 + ["short"])
+        content = make_analyzer(
+            word_count=1200, text_content=text
+        )._analyze_content_depth()
+
+        assert content["paragraph_count"] == 5
+        # 3 (word count) + 1 (paragraphs)
+        assert content["score"] == 4
+
+    def test_paragraph_count_matches_split_semantics(self):
+        """Test that extra blank lines and a trailing paragraph are handled."""
+        long_paragraph = "z" * 101
+        text = (
+            f"{long_paragraph}\n\n\n{long_paragraph}\n\n\n\nshort\n\n{long_paragraph}"
+        )
+        content = make_analyzer(text_content=text)._analyze_content_depth()
+
+        expected = len([p for p in text.split("\n\n") if len(p) > 100])
+        assert content["paragraph_count"] == expected == 3
+
+    def test_score_capped_at_ten(self):
+        """Test that the content depth score never exceeds 10."""
+        nav = [{"text": t} for t in ["News", "Help", "Resources", "About"]]
+        text = "\n\n".join(["y" * 200] * 6)
+        content = make_analyzer(
+            navigation=nav, word_count=5000, text_content=text
+        )._analyze_content_depth()
+
+        assert content["score"] == 10
+
+
+# =============================================================================
+# Test _calculate_score() and readiness
+# =============================================================================
+
+
+class TestScoring:
+    """Tests for the weighted AI discoverability score."""
+
+    def _score(self, raw: Dict[str, Any]) -> float:
+        analyzer = make_analyzer()
+        analyzer._raw_data = raw
+        return analyzer._calculate_score()
+
+    def test_empty_data_scores_zero(self):
+        """Test that missing sections contribute nothing."""
+        assert self._score({}) == 0
+
+    def test_full_presence(self):
+        """Test a brand with every signal maxed out."""
+        raw = {
+            "wikipedia": {"exists": True, "notability_score": 100},
+            "schema": {"schema_score": 100},
+            "content_depth": {"score": 10},
+            "serp": {"brand_in_top_3": True, "knowledge_panel_likely": True},
+        }
+        assert self._score(raw) == 100
+
+    def test_wikipedia_mentions_only(self):
+        """Test that article mentions earn partial credit, capped at 15."""
+        raw = {"wikipedia": {"exists": False, "mentioned_in": ["a", "b", "c", "d"]}}
+        assert self._score(raw) == 15
+
+    def test_mixed_signals(self):
+        """Test a typical mid-range brand."""
+        raw = {
+            "wikipedia": {"exists": True, "notability_score": 50},
+            "schema": {"schema_score": 40},
+            "content_depth": {"score": 5},
+            "serp": {"brand_in_top_10": True},
+        }
+        # 15 (wiki) + 10 (schema) + 10 (content) + 10 (serp) + 5 (wiki panel)
+        assert self._score(raw) == 50
+
+    def test_readiness_levels(self):
+        """Test readiness thresholds."""
+        analyzer = make_analyzer()
+
+        assert analyzer._get_readiness_level(0) == "low"
+        assert analyzer._get_readiness_level(49.9) == "low"
+        assert analyzer._get_readiness_level(50) == "medium"
+        assert analyzer._get_readiness_level(74.9) == "medium"
+        assert analyzer._get_readiness_level(75) == "high"
+        assert analyzer._get_readiness_level(100) == "high"
+
+
+# =============================================================================
+# Test _generate_findings() / _generate_recommendations()
+# =============================================================================
+
+
+class TestFindingsAndRecommendations:
+    """Tests for generated findings and recommendations."""
+
+    def test_static_entries_are_shared(self):
+        """Test that data-independent entries reuse module-level instances."""
+        first, second = make_analyzer(), make_analyzer()
+        for analyzer in (first, second):
+            analyzer._raw_data = {}
+
+        assert first._generate_findings()[0] is NO_WIKIPEDIA_FINDING
+        assert second._generate_findings()[0] is NO_WIKIPEDIA_FINDING
+        assert first._generate_recommendations()[0] is WIKIPEDIA_NOTABILITY_REC
+
+    def test_dynamic_finding_uses_data(self):
+        """Test that data-dependent findings are still built per analysis."""
+        analyzer = make_analyzer()
+        analyzer._raw_data = {"wikipedia": {"mentioned_in": ["A", "B"]}}
+
+        finding = analyzer._generate_findings()[0]
+        assert finding.title == "Mentioned in Wikipedia"
+        assert finding.data == {"articles": ["A", "B"]}
+
+    def test_template_copy_attaches_data(self):
+        """Test that template findings are copied with per-analysis data."""
+        analyzer = make_analyzer()
+        analyzer._raw_data = {"schema": {"count": 1, "types": ["WebSite"]}}
+
+        finding = analyzer._generate_findings()[1]
+        assert finding.title == MISSING_ORGANIZATION_SCHEMA_FINDING.title
+        assert finding.data == {"current_schemas": ["WebSite"]}
+        assert MISSING_ORGANIZATION_SCHEMA_FINDING.data is None
+
+
+# =============================================================================
+# Test analyze() external lookups
+# =============================================================================
+
+
+class TestExternalLookups:
+    """Tests for the concurrent Wikipedia and SERP lookups in analyze()."""
+
+    async def test_lookups_run_concurrently(self, monkeypatch):
+        """Test that the SERP check starts before Wikipedia finishes."""
+        events = []
+
+        async def fake_wiki(self, brand_name):
+            events.append("wiki_start")
+            await asyncio.sleep(0.01)
+            events.append("wiki_end")
+            return WikipediaPresence(success=True, brand_name=brand_name)
+
+        async def fake_serp(self, brand_name):
+            events.append("serp_start")
+            return {"available": True, "brand_in_top_3": True}
+
+        monkeypatch.setattr(WikipediaService, "check_brand_presence", fake_wiki)
+        monkeypatch.setattr(
+            AIDiscoverabilityAnalyzer, "_check_serp_visibility", fake_serp
+        )
+
+        result = await make_analyzer().analyze()
+
+        assert result.is_success()
+        assert events.index("serp_start") < events.index("wiki_end")
+
+    async def test_wikipedia_failure_keeps_serp(self, monkeypatch):
+        """Test that a Wikipedia error doesn't discard the SERP result."""
+
+        async def failing_wiki(self, brand_name):
+            raise RuntimeError("wikipedia down")
+
+        async def fake_serp(self, brand_name):
+            return {"available": True, "brand_in_top_3": True}
+
+        monkeypatch.setattr(WikipediaService, "check_brand_presence", failing_wiki)
+        monkeypatch.setattr(
+            AIDiscoverabilityAnalyzer, "_check_serp_visibility", fake_serp
+        )
+
+        result = await make_analyzer().analyze()
+
+        assert result.is_success()
+        assert result.data["has_wikipedia_page"] is False
+        assert result.data["serp_position"] is None
+        # 15 (top 3) + 0 (no schema/content) + 0 (no panel, no wiki)
+        assert result.score == 15
+
+    async def test_large_text_content_depth_matches(self, monkeypatch):
+        """Test that threaded content depth on large pages gives the same result."""
+
+        async def fake_wiki(self, brand_name):
+            return WikipediaPresence(success=True, brand_name=brand_name)
+
+        async def fake_serp(self, brand_name):
+            return {"available": False}
+
+        monkeypatch.setattr(WikipediaService, "check_brand_presence", fake_wiki)
+        monkeypatch.setattr(
+            AIDiscoverabilityAnalyzer, "_check_serp_visibility", fake_serp
+        )
+
+        text = "\n\n".join(["w" * 150] * (CONTENT_THREAD_MIN_CHARS // 150 + 1))
+        analyzer = make_analyzer(text_content=text, word_count=9000)
+        expected = analyzer._analyze_content_depth()
+
+        result = await analyzer.analyze()
+
+        assert result.is_success()
+        assert analyzer._raw_data["content_depth"] == expected
+
+    async def test_failure_does_not_leave_content_task(self, monkeypatch):
+        """Test that a failing step cleans up the threaded content scan."""
+
+        async def fake_wiki(self, brand_name):
+            return WikipediaPresence(success=True, brand_name=brand_name)
+
+        async def fake_serp(self, brand_name):
+            return {"available": False}
+
+        def failing_schema(self):
+            raise RuntimeError("bad schema")
+
+        release = threading.Event()
+
+        def slow_content_depth(self):
+            release.wait(5)
+            return {}
+
+        monkeypatch.setattr(WikipediaService, "check_brand_presence", fake_wiki)
+        monkeypatch.setattr(
+            AIDiscoverabilityAnalyzer, "_check_serp_visibility", fake_serp
+        )
+        monkeypatch.setattr(
+            AIDiscoverabilityAnalyzer, "_analyze_schema_markup", failing_schema
+        )
+        monkeypatch.setattr(
+            AIDiscoverabilityAnalyzer, "_analyze_content_depth", slow_content_depth
+        )
+
+        text = "\n\n".join(["w" * 150] * (CONTENT_THREAD_MIN_CHARS // 150 + 1))
+        try:
+            result = await make_analyzer(text_content=text).analyze()
+            await asyncio.sleep(0)
+            leftover = asyncio.all_tasks() - {asyncio.current_task()}
+        finally:
+            release.set()
+
+        assert not result.is_success()
+        assert "bad schema" in result.error
+        assert all(task.done() for task in leftover)
+
+    async def test_rate_limited_serp_is_unavailable(self, monkeypatch):
+        """Test that a rate-limited search reports no SERP data, not a low rank."""
+        monkeypatch.setattr(settings, "GOOGLE_API_KEY", "test-key")
+        monkeypatch.setattr(settings, "GOOGLE_SEARCH_ENGINE_ID", "test-cx")
+        monkeypatch.setattr(GoogleSearchService, "QUOTA_WAIT", 0.01)
+
+        async def no_cache(key):
+            return None
+
+        async def never_allowed():
+            return False
+
+        monkeypatch.setattr(cache, "get", no_cache)
+        monkeypatch.setattr(rate_limiters["google_search"], "is_allowed", never_allowed)
+
+        serp = await make_analyzer()._check_serp_visibility("Example")
+
+        assert serp == {
+            "available": False,
+            "error": "Rate limited by Google Search API",
+        }
+
+        analyzer = make_analyzer()
+        analyzer._raw_data = {"serp": serp}
+        titles = [finding.title for finding in analyzer._generate_findings()]
+        assert not any("SERP" in title for title in titles)
+
+    async def test_undetected_brand_skips_lookups(self, monkeypatch):
+        """Test that a placeholder brand name never reaches the network."""
+
+        async def unexpected(self, brand_name):
+            raise AssertionError("lookup should be skipped")
+
+        monkeypatch.setattr(WikipediaService, "check_brand_presence", unexpected)
+        monkeypatch.setattr(
+            AIDiscoverabilityAnalyzer, "_check_serp_visibility", unexpected
+        )
+
+        result = await make_analyzer(brand_name="X").analyze()
+
+        assert result.is_success()
+        assert result.findings[0] is BRAND_NOT_DETECTED_FINDING
+        assert result.data["has_wikipedia_page"] is False
+        assert result.score == 0
+
+
+# =============================================================================
+# Test _get_brand_name()
+# =============================================================================
+
+
+class TestBrandName:
+    """Tests for brand name resolution."""
+
+    def test_scraped_brand_name_wins(self):
+        assert (
+            make_analyzer(brand_name="Acme", title="Other - x")._get_brand_name()
+            == "Acme"
+        )
+
+    def test_title_separator(self):
+        assert make_analyzer(title="Acme | Rockets")._get_brand_name() == "Acme"
+
+    def test_title_separator_priority(self):
+        """Test that separator priority beats position in the title."""
+        title = "Acme: Rockets - Home"
+        assert make_analyzer(title=title)._get_brand_name() == "Acme: Rockets"
+        assert make_analyzer(title="Acme: Rockets")._get_brand_name() == "Acme"
+
+    def test_domain_fallback(self):
+        assert make_analyzer()._get_brand_name() == "Example"
@@ -0,0 +1,47 @@
+# =============================================================================
+# Content Analyzer Test Suite
+# =============================================================================
+# Regression tests for website topic detection in the content analyzer.
+#
+# Run with: pytest tests/test_content.py -v
+# =============================================================================
+
+from app.analyzers.content import ContentAnalyzer
+
+
+def detect_topics(text: str) -> list:
+    analyzer = ContentAnalyzer(
+        url="https://www.example.com", scraped_data={"text_content": text}
+    )
+    return analyzer._analyze_web_content()["topics"]
+
+
+# =============================================================================
+# Test _analyze_web_content()
+# =============================================================================
+
+
+class TestTopicDetection:
+    """Tests for whole-word topic detection."""
+
+    def test_plural_forms(self):
+        """Test that plurals of topic keywords are detected."""
+        assert detect_topics("Accept payments from anywhere.") == ["finance"]
+        assert detect_topics("Built for thriving communities.") == ["community"]
+
+    def test_stem_forms(self):
+        """Test that words built on a keyword stem are detected."""
+        assert detect_topics("Trusted by investors worldwide.") == ["finance"]
+        assert detect_topics("Start investing today") == ["finance"]
+        assert detect_topics("Buy cryptocurrency safely") == ["crypto"]
+        assert detect_topics("The fintech for freelancers") == ["technology"]
+
+    def test_no_match_inside_unrelated_words(self):
+        """Test that keywords hidden inside other words are ignored."""
+        assert detect_topics("Rapid growth and capital efficiency") == []
+
+    def test_reporting_order_and_limit(self):
+        """Test that topics follow TOPIC_KEYWORDS order, capped at three."""
+        text = "Our community of investors uses blockchain software."
+
+        assert detect_topics(text) == ["technology", "finance", "crypto"]
@@ -0,0 +1,114 @@
+# =============================================================================
+# Analysis Orchestrator Test Suite
+# =============================================================================
+# Tests for the analyzer result cache used by the orchestrator.
+#
+# Run with: pytest tests/test_orchestrator.py -v
+# =============================================================================
+
+from typing import Any, Dict
+
+import pytest
+
+from app.analyzers.base import AnalyzerResult
+from app.analyzers.orchestrator import AnalysisOrchestrator, _result_to_cache
+from app.utils.cache import cache
+
+
+class FakeAnalyzer:
+    """Analyzer stand-in that counts runs and returns a fixed result."""
+
+    def __init__(self, result: AnalyzerResult, raw_data: Dict[str, Any] = None):
+        self.result = result
+        self._raw_data = raw_data or {}
+        self.runs = 0
+
+    async def analyze(self) -> AnalyzerResult:
+        self.runs += 1
+        return self.result
+
+
+@pytest.fixture
+def fake_cache(monkeypatch) -> Dict[str, Any]:
+    """Replace the Redis cache with an in-memory dict."""
+    store: Dict[str, Any] = {}
+
+    async def get(key):
+        return store.get(key)
+
+    async def set(key, value, ttl=None):
+        store[key] = value
+        return True
+
+    monkeypatch.setattr(cache, "get", get)
+    monkeypatch.setattr(cache, "set", set)
+    return store
+
+
+def make_orchestrator() -> AnalysisOrchestrator:
+    orchestrator = AnalysisOrchestrator(url="https://www.example.com")
+    orchestrator._scrape_digest = "digest"
+    return orchestrator
+
+
+# =============================================================================
+# Test _analyze_cached()
+# =============================================================================
+
+
+class TestAnalyzerResultCache:
+    """Tests for reusing analyzer results across runs."""
+
+    async def test_miss_runs_and_stores(self, fake_cache):
+        """Test that a cache miss runs the analyzer and stores its result."""
+        analyzer = FakeAnalyzer(AnalyzerResult(score=70, data={"k": 1}))
+
+        result = await make_orchestrator()._analyze_cached("seo", analyzer)
+
+        assert analyzer.runs == 1
+        assert result.score == 70
+        assert list(fake_cache.values()) == [_result_to_cache(result)]
+
+    async def test_hit_skips_analyzer(self, fake_cache):
+        """Test that a stored result is reused without running the analyzer."""
+        orchestrator = make_orchestrator()
+        await orchestrator._analyze_cached(
+            "seo", FakeAnalyzer(AnalyzerResult(score=70, data={"k": 1}))
+        )
+        analyzer = FakeAnalyzer(AnalyzerResult(score=10))
+
+        result = await orchestrator._analyze_cached("seo", analyzer)
+
+        assert analyzer.runs == 0
+        assert result.score == 70
+        assert result.data == {"k": 1}
+
+    async def test_failed_result_not_stored(self, fake_cache):
+        """Test that a failed result is never cached."""
+        analyzer = FakeAnalyzer(AnalyzerResult.failure("boom"))
+
+        await make_orchestrator()._analyze_cached("seo", analyzer)
+
+        assert fake_cache == {}
+
+    async def test_failed_lookup_not_stored(self, fake_cache):
+        """Test that a result built on a failed external lookup isn't cached."""
+        raw_data = {
+            "serp": {"available": False, "error": "Rate limited"},
+            "schema": {"types": []},
+        }
+        analyzer = FakeAnalyzer(AnalyzerResult(score=40), raw_data)
+
+        await make_orchestrator()._analyze_cached("ai_discoverability", analyzer)
+
+        assert fake_cache == {}
+
+    async def test_unconfigured_lookup_still_stored(self, fake_cache):
+        """Test that a lookup skipped without an error doesn't block caching."""
+        analyzer = FakeAnalyzer(
+            AnalyzerResult(score=40), {"serp": {"available": False}}
+        )
+
+        await make_orchestrator()._analyze_cached("ai_discoverability", analyzer)
+
+        assert len(fake_cache) == 1
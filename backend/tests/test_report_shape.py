@@ -8,6 +8,7 @@
 # Run with: pytest tests/test_report_shape.py -v
 # =============================================================================
 
+import json
 import pytest
 from datetime import datetime
 
@@ -36,6 +37,9 @@ from app.models.report import (
     TeamMember,
     ChannelScore,
 )
+from app.analyzers.base import AnalyzerResult
+from app.analyzers.channel_fit import ChannelFitAnalyzer
+from app.analyzers.orchestrator import _result_from_cache, _result_to_cache
 
 
 # =============================================================================
@@ -487,6 +491,87 @@ class TestScoreRanges:
             assert 0 <= score <= 100, f"Module {module} score {score} out of range"
 
 
+# =============================================================================
+# Test Channel Fit Profiles
+# =============================================================================
+
+
+def score_channels(product_type: str, industry: str = None) -> dict:
+    analyzer = ChannelFitAnalyzer(
+        url="https://www.example.com",
+        industry=industry,
+        scraped_data={"social_links": {"twitter": "https://x.com/example"}},
+    )
+    return {c.channel: c for c in analyzer._score_channels(product_type)}
+
+
+class TestChannelFitProfiles:
+    """Tests pinning the channel-fit scores, labels and rationales."""
+
+    def test_b2b_profile(self):
+        """Test B2B scores and suitability labels."""
+        channels = score_channels("B2B")
+
+        assert {name: (c.score, c.suitability) for name, c in channels.items()} == {
+            "twitter": (7, "high"),
+            "linkedin": (8, "high"),
+            "tiktok": (3, "low"),
+            "youtube": (7, "high"),
+            "discord": (6, "medium"),
+        }
+        assert channels["tiktok"].rationale == (
+            "Low priority for B2B/technical products."
+        )
+        assert channels["twitter"].rationale == (
+            "Good for thought leadership and announcements."
+        )
+
+    def test_b2c_profile(self):
+        """Test B2C scores; TikTok at 7 is labelled high like other 7s."""
+        channels = score_channels("B2C")
+
+        assert {name: (c.score, c.suitability) for name, c in channels.items()} == {
+            "twitter": (6, "medium"),
+            "linkedin": (5, "medium"),
+            "tiktok": (7, "high"),
+            "youtube": (7, "high"),
+            "discord": (6, "medium"),
+        }
+        assert channels["tiktok"].rationale == (
+            "Best for visual, consumer-focused content."
+        )
+        assert channels["discord"].rationale == "Good for engaged user communities."
+
+    @pytest.mark.parametrize("product_type", ["B2B", "B2C"])
+    def test_crypto_overrides(self, product_type: str):
+        """Test that crypto overrides Twitter and Discord only."""
+        channels = score_channels(product_type, industry="Crypto / Web3")
+        baseline = score_channels(product_type)
+
+        assert (channels["twitter"].score, channels["twitter"].rationale) == (
+            9,
+            "Essential for real-time engagement and industry conversations.",
+        )
+        assert (channels["discord"].score, channels["discord"].rationale) == (
+            9,
+            "Essential for community building in crypto/gaming.",
+        )
+        for name in ("linkedin", "tiktok", "youtube"):
+            assert channels[name] == baseline[name]
+
+    def test_sorted_by_score_with_presence(self):
+        """Test channels are sorted by score and flag existing presence."""
+        analyzer = ChannelFitAnalyzer(
+            url="https://www.example.com",
+            scraped_data={"social_links": {"twitter": "https://x.com/example"}},
+        )
+        scores = [c.score for c in analyzer._score_channels("B2B")]
+
+        assert scores == sorted(scores, reverse=True)
+        assert score_channels("B2B")["twitter"].current_presence
+        assert not score_channels("B2B")["linkedin"].current_presence
+
+
 # =============================================================================
 # Test Model Validation
 # =============================================================================
@@ -552,6 +637,16 @@ class TestModelValidation:
                 assert rec.impact == impact
                 assert rec.effort == effort
 
+    def test_finding_and_recommendation_are_frozen(self):
+        """Test that emitted findings/recommendations cannot be mutated."""
+        finding = Finding(title="Test", detail="Test detail")
+        rec = Recommendation(title="Test", description="Test", category="test")
+
+        with pytest.raises(ValidationError):
+            finding.severity = SeverityLevel.HIGH
+        with pytest.raises(ValidationError):
+            rec.priority = SeverityLevel.HIGH
+
 
 # =============================================================================
 # Test Report Serialization
@@ -588,6 +683,33 @@ class TestReportSerialization:
         assert report_dict["channel_fit"]["score"] == 60.0
         assert report_dict["scorecard"]["overall_score"] == 67.5
 
+    def test_analyzer_result_cache_round_trip(self):
+        """Test that cached analyzer results rebuild the same findings."""
+        result = AnalyzerResult(
+            score=42.0,
+            findings=[Finding(title="T", detail="D", severity=SeverityLevel.HIGH)],
+            recommendations=[
+                Recommendation(
+                    title="R",
+                    description="Do it",
+                    priority=SeverityLevel.LOW,
+                    category="seo",
+                )
+            ],
+            data={"score": 42.0, "items": ["a", "b"]},
+        )
+
+        cached = json.loads(json.dumps(_result_to_cache(result)))
+        restored = _result_from_cache(cached)
+
+        assert restored == result
+
+    def test_analyzer_result_with_non_json_data_not_cached(self):
+        """Test that results whose data won't round-trip are skipped."""
+        result = AnalyzerResult(score=1.0, data={"when": datetime.now()})
+
+        assert _result_to_cache(result) is None
+
 
 # =============================================================================
 # Test Edge Cases
@@ -294,6 +294,18 @@ class TestScoreToRating:
         assert BaseAnalyzer.score_to_rating(20) == "critical"
         assert BaseAnalyzer.score_to_rating(0) == "critical"
 
+    def test_fractional_scores_at_thresholds(self):
+        """Test that thresholds are inclusive for fractional scores."""
+        assert BaseAnalyzer.score_to_rating(89.99) == "good"
+        assert BaseAnalyzer.score_to_rating(74.5) == "fair"
+        assert BaseAnalyzer.score_to_rating(59.9) == "poor"
+        assert BaseAnalyzer.score_to_rating(39.99) == "critical"
+        assert BaseAnalyzer.score_to_rating(40.0) == "poor"
+
+    def test_nan_is_critical(self):
+        """Test that a NaN score falls into the lowest band."""
+        assert BaseAnalyzer.score_to_rating(float("nan")) == "critical"
+
 
 # =============================================================================
 # Regression Tests - Known Score Scenarios